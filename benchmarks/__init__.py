@@ -0,0 +1,5 @@
+"""Benchmarks for the Python side of InnerVoice.
+
+Each module is runnable on its own (``python -m benchmarks.<name>``) and prints
+its results as JSON so runs can be compared with each other.
+"""
@@ -0,0 +1,42 @@
+"""Run the benchmark suites and write one combined JSON result file.
+
+Usage::
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --only persona pipeline
+    python -m benchmarks.compare baseline.json results.json
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Callable, Dict, Sequence
+
+from . import e2e, persona, pipeline, reduction, vector_store, vector_store_concurrency
+from .common import environment, write_results
+
+SUITES: Dict[str, Callable[[], Dict[str, object]]] = {
+    "vector_store": vector_store.run,
+    "vector_store_concurrency": vector_store_concurrency.run,
+    "reduction": reduction.run,
+    "pipeline": pipeline.run,
+    "persona": persona.run,
+    "e2e": e2e.run,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), help="Run only these suites")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    selected = args.only or list(SUITES)
+    results: Dict[str, object] = {
+        "environment": environment(),
+        "suites": {name: SUITES[name]() for name in selected},
+    }
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Shared helpers for timing benchmark cases and writing comparable results."""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def time_calls(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Call ``func`` ``repeat`` times and summarise the per-call latency in ms."""
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": repeat,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def environment() -> Dict[str, object]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_results(results: Dict[str, object], output: str | Path | None) -> None:
+    """Print ``results`` as JSON and optionally persist them to ``output``."""
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if output is not None:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+
+__all__ = ["ROOT_DIR", "environment", "time_calls", "write_results"]
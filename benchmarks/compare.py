@@ -0,0 +1,102 @@
+"""Compare two benchmark JSON files and flag regressions.
+
+Latency metrics (``*_ms``) regress when they grow, throughput (``*_per_s``)
+and recall (``recall_*``) metrics regress when they shrink. Other numbers are
+reported but never counted as regressions.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json current.json --threshold 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+# Fields that identify a case inside a list rather than measure it.
+_IDENTITY_KEYS = (
+    "size",
+    "dimension",
+    "threads",
+    "clients",
+    "batch_size",
+    "messages",
+    "method",
+    "target_dimension",
+    "candidates",
+)
+
+
+def _case_label(item: dict, index: int) -> str:
+    parts = [f"{key}={item[key]}" for key in _IDENTITY_KEYS if key in item]
+    return ",".join(parts) if parts else str(index)
+
+
+def flatten(node: object, prefix: str = "") -> Dict[str, float]:
+    """Map dotted paths to every numeric leaf, skipping run environment details."""
+
+    values: Dict[str, float] = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "environment":
+                continue
+            values.update(flatten(value, f"{prefix}.{key}" if prefix else key))
+    elif isinstance(node, list):
+        for index, item in enumerate(node):
+            label = _case_label(item, index) if isinstance(item, dict) else str(index)
+            values.update(flatten(item, f"{prefix}[{label}]"))
+    elif isinstance(node, (int, float)) and not isinstance(node, bool):
+        values[prefix] = float(node)
+    return values
+
+
+def _direction(path: str) -> int:
+    leaf = path.rsplit(".", 1)[-1]
+    if leaf.endswith("_ms"):
+        return -1
+    if leaf.endswith("_per_s") or leaf.startswith("recall_"):
+        return 1
+    return 0
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> Tuple[List[str], List[str]]:
+    """Return report lines and the paths that regressed by more than ``threshold`` percent."""
+
+    before = flatten(baseline)
+    after = flatten(current)
+    lines: List[str] = []
+    regressions: List[str] = []
+    for path in sorted(before.keys() & after.keys()):
+        direction = _direction(path)
+        if direction == 0 or before[path] == 0:
+            continue
+        change = (after[path] - before[path]) / before[path] * 100
+        regressed = change * direction < -threshold
+        marker = "REGRESSION" if regressed else ""
+        lines.append(f"{path}: {before[path]:g} -> {after[path]:g} ({change:+.1f}%) {marker}".rstrip())
+        if regressed:
+            regressions.append(path)
+    return lines, regressions
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    lines, regressions = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Synthetic corpora and vectors for reproducible benchmarks.
+
+The journal generator stitches German sentence fragments that hit the persona
+keyword lists, the sentiment word lists and neutral filler in roughly the
+proportions seen in real entries. Everything is driven by an explicit seed so
+two runs see identical input.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import time
+from array import array
+from typing import List, Sequence
+
+from core.embeddings.model_loader import BaseEmbeddingModel
+
+_OPENERS = [
+    "Heute",
+    "Seit dem Morgen",
+    "Gestern Abend",
+    "Eben gerade",
+    "Nach dem Gespräch mit meiner Schwester",
+    "Auf dem Weg zur Arbeit",
+    "Beim Spaziergang",
+]
+
+_FEELINGS = [
+    "habe ich Angst, dass alles zu viel wird",
+    "bin ich müde und überfordert",
+    "spüre ich wieder diese Sorge im Bauch",
+    "bin ich dankbar für die kleinen Dinge",
+    "fühle ich mich motiviert und stark",
+    "bin ich traurig, ohne genau zu wissen warum",
+    "bin ich wütend auf mich selbst",
+    "habe ich Hoffnung, dass es besser wird",
+    "bin ich einfach zufrieden",
+]
+
+_TOPICS = [
+    "mein Projekt im Büro",
+    "die Beziehung zu meinem Vater",
+    "der Umzug in die neue Wohnung",
+    "meine Gesundheit",
+    "das Studium",
+    "die Freundschaft mit Lena",
+    "der nächste Schritt in meiner Karriere",
+    "meine Zweifel am Plan",
+]
+
+_REFLECTIONS = [
+    "Ich frage mich, was ich wirklich will.",
+    "Vielleicht sollte ich eine Liste mit Optionen machen.",
+    "Ich weiß nicht, ob ich das kann.",
+    "Was würde ich einer Freundin raten?",
+    "Ich möchte ruhig bleiben und tief durchatmen.",
+    "Es fühlt sich an, als würde ich scheitern.",
+    "Ich will einen klaren Plan und eine Entscheidung.",
+    "Morgen probiere ich einen kleinen Schritt.",
+]
+
+
+def journal_entry(rng: random.Random) -> str:
+    """Return one synthetic journal entry of one to four sentences."""
+
+    sentences = [f"{rng.choice(_OPENERS)} {rng.choice(_FEELINGS)}."]
+    sentences.append(f"Es geht um {rng.choice(_TOPICS)}.")
+    for _ in range(rng.randint(0, 2)):
+        sentences.append(rng.choice(_REFLECTIONS))
+    if rng.random() < 0.15:
+        sentences[-1] = sentences[-1].rstrip(".?") + "!"
+    return " ".join(sentences)
+
+
+def journal_corpus(size: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [journal_entry(rng) for _ in range(size)]
+
+
+def random_vector(rng: random.Random, dimension: int) -> List[float]:
+    return [rng.uniform(-1.0, 1.0) for _ in range(dimension)]
+
+
+def random_vectors(count: int, dimension: int, seed: int = 11) -> List[List[float]]:
+    rng = random.Random(seed)
+    return [random_vector(rng, dimension) for _ in range(count)]
+
+
+class StubEmbeddingModel(BaseEmbeddingModel):
+    """Deterministic, dependency-free model that hashes text into a unit vector.
+
+    It stands in for ONNX/TFLite backends so pipeline and retrieval overhead
+    can be measured without model files. ``cost_per_text`` adds a fixed
+    simulated inference time in seconds per text.
+    """
+
+    def __init__(self, dimension: int = 384, cost_per_text: float = 0.0) -> None:
+        self.dimension = dimension
+        self.cost_per_text = cost_per_text
+
+    def _vector(self, text: str) -> List[float]:
+        values = array("f")
+        counter = 0
+        while len(values) < self.dimension:
+            digest = hashlib.blake2b(f"{counter}:{text}".encode("utf-8"), digest_size=64).digest()
+            values.extend((byte - 127.5) / 127.5 for byte in digest)
+            counter += 1
+        del values[self.dimension:]
+        norm = math.sqrt(sum(value * value for value in values)) or 1.0
+        return [value / norm for value in values]
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        if self.cost_per_text:
+            time.sleep(self.cost_per_text * len(texts))
+        return [self._vector(text) for text in texts]
+
+
+__all__ = [
+    "StubEmbeddingModel",
+    "journal_corpus",
+    "journal_entry",
+    "random_vector",
+    "random_vectors",
+]
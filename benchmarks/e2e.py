@@ -0,0 +1,141 @@
+"""End-to-end ``/api/respond`` throughput against a local server.
+
+Without ``--url`` an in-process server is started on a free port with a
+temporary interaction database, so runs never touch ``data/``.
+
+Usage::
+
+    python -m benchmarks.e2e --clients 1 4 --duration 5
+    python -m benchmarks.e2e --url http://localhost:8000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+from src.db import InteractionStore
+from src.persona_loader import PersonaRepository
+from src.responder import PersonaResponder
+from src.server import PERSONA_DIR, TEMPLATE_DIR, InnerVoiceHandler
+from src.state_machine import PersonaStateMachine
+
+from .common import environment, write_results
+from .corpora import journal_corpus
+
+
+@contextmanager
+def local_server() -> Iterator[str]:
+    """Serve the app on an ephemeral port and yield its base URL."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = PersonaRepository(PERSONA_DIR, TEMPLATE_DIR)
+        personas = repository.personas
+
+        class BenchmarkHandler(InnerVoiceHandler):
+            pass
+
+        BenchmarkHandler.repository = repository
+        BenchmarkHandler.state_machine = PersonaStateMachine(personas)
+        BenchmarkHandler.responder = PersonaResponder(personas)
+        BenchmarkHandler.store = InteractionStore(str(Path(tmp) / "interactions.sqlite"))
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), BenchmarkHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{httpd.server_address[1]}"
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+
+def _post(url: str, message: str) -> None:
+    request = urllib.request.Request(
+        f"{url}/api/respond",
+        data=json.dumps({"message": message}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        response.read()
+
+
+def bench_case(url: str, corpus: Sequence[str], clients: int, duration: float) -> Dict[str, object]:
+    stop = threading.Event()
+    latencies: List[List[float]] = [[] for _ in range(clients)]
+    errors = [0] * clients
+
+    def client(slot: int) -> None:
+        index = slot
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                _post(url, corpus[index % len(corpus)])
+            except OSError:
+                errors[slot] += 1
+            else:
+                latencies[slot].append((time.perf_counter() - started) * 1000)
+            index += clients
+
+    workers = [threading.Thread(target=client, args=(slot,)) for slot in range(clients)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(value for slot in latencies for value in slot)
+    result: Dict[str, object] = {
+        "clients": clients,
+        "requests": len(samples),
+        "errors": sum(errors),
+        "requests_per_s": round(len(samples) / elapsed, 2),
+    }
+    if samples:
+        result["p50_ms"] = round(samples[len(samples) // 2], 3)
+        result["p95_ms"] = round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3)
+    return result
+
+
+def run(
+    url: str | None = None,
+    clients: Sequence[int] = (1, 4),
+    duration: float = 3.0,
+    seed: int = 7,
+) -> Dict[str, object]:
+    corpus = journal_corpus(500, seed)
+    results: Dict[str, object] = {"benchmark": "e2e", "target": url or "in-process", "duration_s": duration}
+    if url is not None:
+        results["cases"] = [bench_case(url.rstrip("/"), corpus, count, duration) for count in clients]
+        return results
+    with local_server() as local_url:
+        results["cases"] = [bench_case(local_url, corpus, count, duration) for count in clients]
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark an already running server instead of an in-process one")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    results = run(args.url, args.clients, args.duration, args.seed)
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
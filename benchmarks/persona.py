@@ -0,0 +1,60 @@
+"""Per-message cost of ``PersonaStateMachine.resolve`` and ``PersonaResponder.render``.
+
+Usage::
+
+    python -m benchmarks.persona --messages 2000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Dict, Sequence
+
+from src.persona_loader import PersonaRepository
+from src.responder import PersonaResponder
+from src.server import PERSONA_DIR, TEMPLATE_DIR
+from src.state_machine import PersonaStateMachine
+
+from .common import environment, time_calls, write_results
+from .corpora import journal_corpus
+
+
+def run(messages: int = 2000, seed: int = 7) -> Dict[str, object]:
+    personas = PersonaRepository(PERSONA_DIR, TEMPLATE_DIR).load()
+    corpus = journal_corpus(messages, seed)
+    # The responder picks templates and actions at random; pin it for repeatable runs.
+    random.seed(seed)
+
+    state_machine = PersonaStateMachine(personas)
+    resolve_iter = iter(corpus)
+    resolve = time_calls(lambda: state_machine.resolve(next(resolve_iter)), messages)
+
+    state_machine = PersonaStateMachine(personas)
+    states = [(message, state_machine.resolve(message)) for message in corpus]
+    responder = PersonaResponder(personas)
+    render_iter = iter(states)
+    render = time_calls(lambda: responder.render(*next(render_iter)), messages)
+
+    mean_length = sum(len(message) for message in corpus) / len(corpus)
+    return {
+        "benchmark": "persona",
+        "messages": messages,
+        "mean_message_chars": round(mean_length, 1),
+        "resolve": resolve,
+        "render": render,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    results = run(args.messages, args.seed)
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
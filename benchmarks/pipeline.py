@@ -0,0 +1,62 @@
+"""``EmbeddingPipeline`` throughput with the stub model across batch sizes.
+
+Usage::
+
+    python -m benchmarks.pipeline --texts 2000 --batch-sizes 1 8 32
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List, Sequence
+
+from core.embeddings.pipeline import EmbeddingPipeline
+
+from .common import environment, write_results
+from .corpora import StubEmbeddingModel, journal_corpus
+
+
+def bench_case(texts: Sequence[str], batch_size: int, dimension: int, cost_per_text: float) -> Dict[str, object]:
+    pipeline = EmbeddingPipeline(StubEmbeddingModel(dimension, cost_per_text))
+    started = time.perf_counter()
+    for offset in range(0, len(texts), batch_size):
+        pipeline(texts[offset : offset + batch_size])
+    elapsed = time.perf_counter() - started
+    return {
+        "batch_size": batch_size,
+        "dimension": dimension,
+        "texts": len(texts),
+        "texts_per_s": round(len(texts) / elapsed, 2),
+    }
+
+
+def run(
+    texts: int = 2000,
+    batch_sizes: Sequence[int] = (1, 8, 32),
+    dimension: int = 384,
+    cost_per_text: float = 0.0,
+    seed: int = 7,
+) -> Dict[str, object]:
+    corpus = journal_corpus(texts, seed)
+    cases: List[Dict[str, object]] = [
+        bench_case(corpus, batch_size, dimension, cost_per_text) for batch_size in batch_sizes
+    ]
+    return {"benchmark": "pipeline", "cost_per_text_s": cost_per_text, "cases": cases}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--cost-per-text", type=float, default=0.0, help="Simulated inference seconds per text")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    results = run(args.texts, args.batch_sizes, args.dimension, args.cost_per_text, args.seed)
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
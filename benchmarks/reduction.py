@@ -0,0 +1,146 @@
+"""Recall@k versus latency for reduced-dimension search with exact re-ranking.
+
+Vectors are drawn from a low-rank model (a few latent factors mixed into the
+full dimension plus noise), which is how real sentence embeddings behave and
+what gives PCA something to find. Each configuration is compared against an
+exact scan of the same store. PCA cases are skipped when numpy is missing.
+
+Usage::
+
+    python -m benchmarks.reduction --vectors 2000 --dimension 256 --targets 16 32 64
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from core.storage.reduction import PCA, PREFIX, ProjectionError
+from core.storage.sqlite_vector_store import SQLiteVectorStore
+
+from .common import environment, write_results
+
+_SESSION = "bench"
+
+
+def low_rank_vectors(count: int, dimension: int, rank: int, noise: float, seed: int) -> List[List[float]]:
+    rng = random.Random(seed)
+    mixing = [[rng.gauss(0.0, 1.0) for _ in range(dimension)] for _ in range(rank)]
+    vectors: List[List[float]] = []
+    for _ in range(count):
+        latent = [rng.gauss(0.0, 1.0) for _ in range(rank)]
+        vector = [rng.gauss(0.0, noise) for _ in range(dimension)]
+        for weight, row in zip(latent, mixing):
+            for index, value in enumerate(row):
+                vector[index] += weight * value
+        vectors.append(vector)
+    return vectors
+
+
+def _measure(store: SQLiteVectorStore, queries: Sequence[Sequence[float]], top_k: int, candidates: int | None, exact: bool):
+    ids: List[List[str]] = []
+    started = time.perf_counter()
+    for query in queries:
+        results = store.search(_SESSION, query, top_k=top_k, candidates=candidates, exact=exact)
+        ids.append([result.vector_id for result in results])
+    elapsed_ms = (time.perf_counter() - started) * 1000 / len(queries)
+    return ids, round(elapsed_ms, 3)
+
+
+def _recall(expected: List[List[str]], actual: List[List[str]]) -> float:
+    hits = sum(len(set(want) & set(got)) for want, got in zip(expected, actual))
+    total = sum(len(want) for want in expected)
+    return round(hits / total, 4) if total else 1.0
+
+
+def run(
+    vectors: int = 2000,
+    dimension: int = 256,
+    rank: int = 16,
+    noise: float = 0.3,
+    targets: Sequence[int] = (16, 32, 64),
+    methods: Sequence[str] = (PREFIX, PCA),
+    top_k: int = 10,
+    candidates: Sequence[int] = (20, 50),
+    queries: int = 30,
+    seed: int = 3,
+) -> Dict[str, object]:
+    data = low_rank_vectors(vectors + queries, dimension, rank, noise, seed)
+    corpus, query_vectors = data[:vectors], data[vectors:]
+    results: Dict[str, object] = {
+        "benchmark": "reduction",
+        "vectors": vectors,
+        "dimension": dimension,
+        "rank": rank,
+        "top_k": top_k,
+        "cases": [],
+        "skipped": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteVectorStore(Path(tmp) / "vectors.sqlite", dimension=dimension)
+        try:
+            store.add_many(_SESSION, corpus)
+            expected, exact_ms = _measure(store, query_vectors, top_k, None, exact=True)
+            results["exact_ms"] = exact_ms
+            for method in methods:
+                for target in targets:
+                    try:
+                        fit_started = time.perf_counter()
+                        store.fit_projection(method, target)
+                        fit_s = round(time.perf_counter() - fit_started, 3)
+                    except ProjectionError as exc:
+                        results["skipped"].append({"method": method, "target_dimension": target, "reason": str(exc)})
+                        continue
+                    for candidate_count in candidates:
+                        actual, search_ms = _measure(store, query_vectors, top_k, candidate_count, exact=False)
+                        results["cases"].append(
+                            {
+                                "method": method,
+                                "target_dimension": target,
+                                "candidates": candidate_count,
+                                "fit_s": fit_s,
+                                "recall_at_k": _recall(expected, actual),
+                                "search_ms": search_ms,
+                                "speedup": round(exact_ms / search_ms, 2) if search_ms else None,
+                            }
+                        )
+        finally:
+            store.close()
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=2000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--rank", type=int, default=16)
+    parser.add_argument("--noise", type=float, default=0.3)
+    parser.add_argument("--targets", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--methods", nargs="+", choices=[PREFIX, PCA], default=[PREFIX, PCA])
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[20, 50])
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    results = run(
+        vectors=args.vectors,
+        dimension=args.dimension,
+        rank=args.rank,
+        noise=args.noise,
+        targets=args.targets,
+        methods=args.methods,
+        top_k=args.top_k,
+        candidates=args.candidates,
+        queries=args.queries,
+        seed=args.seed,
+    )
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
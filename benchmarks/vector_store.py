@@ -0,0 +1,78 @@
+"""Insert and search cost of ``SQLiteVectorStore`` by store size and dimension.
+
+Usage::
+
+    python -m benchmarks.vector_store --sizes 1000 10000 --dimensions 64 384
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from core.storage.sqlite_vector_store import SQLiteVectorStore
+
+from .common import environment, time_calls, write_results
+from .corpora import random_vector
+
+_SESSION = "bench"
+_BATCH = 1000
+
+
+def bench_case(size: int, dimension: int, queries: int, seed: int) -> Dict[str, object]:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteVectorStore(Path(tmp) / "vectors.sqlite", dimension=dimension)
+        try:
+            insert_seconds = 0.0
+            remaining = size
+            while remaining:
+                batch = [random_vector(rng, dimension) for _ in range(min(_BATCH, remaining))]
+                started = time.perf_counter()
+                store.add_many(_SESSION, batch)
+                insert_seconds += time.perf_counter() - started
+                remaining -= len(batch)
+
+            query_vectors = [random_vector(rng, dimension) for _ in range(queries)]
+            cursor = iter(query_vectors)
+            search = time_calls(lambda: store.search(_SESSION, next(cursor), top_k=5), queries)
+        finally:
+            store.close()
+    return {
+        "size": size,
+        "dimension": dimension,
+        "insert_vectors_per_s": round(size / insert_seconds, 2) if insert_seconds else None,
+        "search": search,
+    }
+
+
+def run(
+    sizes: Sequence[int] = (1000, 10000),
+    dimensions: Sequence[int] = (64, 384),
+    queries: int = 20,
+    seed: int = 5,
+) -> Dict[str, object]:
+    cases: List[Dict[str, object]] = [
+        bench_case(size, dimension, queries, seed) for size in sizes for dimension in dimensions
+    ]
+    return {"benchmark": "vector_store", "cases": cases}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[64, 384])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+    results = run(args.sizes, args.dimensions, args.queries, args.seed)
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
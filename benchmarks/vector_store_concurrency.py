@@ -0,0 +1,166 @@
+"""Multi-threaded load benchmark for the SQLite vector stores.
+
+Populates a store with random vectors spread over several sessions and then
+hammers ``search`` from an increasing number of threads while one background
+thread inserts at a fixed rate into a session the readers never query. Every
+thread count gets a freshly populated store, so the searched data is the same
+for each case and throughput can be compared across thread counts. Results
+are reported for both a single ``SQLiteVectorStore`` and a
+``ShardedSQLiteVectorStore``.
+
+Usage::
+
+    python -m benchmarks.vector_store_concurrency --vectors 2000 --threads 1 2 4 8 --write-rate 50
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+from core.storage.sqlite_vector_store import ShardedSQLiteVectorStore, SQLiteVectorStore
+
+from .common import environment, write_results
+from .corpora import random_vector as _random_vector
+
+# Writes go here so they contend for the database without growing the searched sessions.
+_WRITER_SESSION = "writer"
+
+
+def _populate(store, sessions: Sequence[str], vectors: int, dimension: int, seed: int) -> None:
+    rng = random.Random(seed)
+    per_session = max(1, vectors // len(sessions))
+    for session_id in sessions:
+        batch = [_random_vector(rng, dimension) for _ in range(per_session)]
+        store.add_many(session_id, batch)
+
+
+def _run_load(
+    store,
+    sessions: Sequence[str],
+    dimension: int,
+    threads: int,
+    duration: float,
+    write_rate: float,
+    seed: int,
+) -> Dict[str, float]:
+    stop = threading.Event()
+    counts = [0] * threads
+    writes = [0]
+
+    def reader(slot: int) -> None:
+        rng = random.Random(seed + slot)
+        while not stop.is_set():
+            store.search(rng.choice(sessions), _random_vector(rng, dimension), top_k=5)
+            counts[slot] += 1
+
+    def writer() -> None:
+        rng = random.Random(seed - 1)
+        interval = 1.0 / write_rate
+        next_write = time.perf_counter()
+        while not stop.is_set():
+            store.add_vector(_WRITER_SESSION, _random_vector(rng, dimension))
+            writes[0] += 1
+            next_write += interval
+            stop.wait(max(0.0, next_write - time.perf_counter()))
+
+    workers = [threading.Thread(target=reader, args=(slot,)) for slot in range(threads)]
+    if write_rate > 0:
+        workers.append(threading.Thread(target=writer))
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "threads": threads,
+        "searches": sum(counts),
+        "searches_per_s": round(sum(counts) / elapsed, 2),
+        "writes_per_s": round(writes[0] / elapsed, 2),
+    }
+
+
+def run(
+    vectors: int = 2000,
+    dimension: int = 64,
+    sessions: int = 8,
+    thread_counts: Sequence[int] = (1, 2, 4, 8),
+    duration: float = 2.0,
+    shards: int = 4,
+    write_rate: float = 50.0,
+    seed: int = 13,
+) -> Dict[str, object]:
+    session_ids = [f"session-{index}" for index in range(sessions)]
+    layouts: Dict[str, Callable[[Path], object]] = {
+        "single": lambda root: SQLiteVectorStore(
+            root / "single.sqlite", dimension=dimension, read_pool_size=max(thread_counts)
+        ),
+        "sharded": lambda root: ShardedSQLiteVectorStore(
+            root / "sharded", shards=shards, dimension=dimension, read_pool_size=max(thread_counts)
+        ),
+    }
+    results: Dict[str, object] = {
+        "benchmark": "vector_store_concurrency",
+        "vectors": vectors,
+        "dimension": dimension,
+        "sessions": sessions,
+        "shards": shards,
+        "duration_s": duration,
+        "write_rate": write_rate,
+        "layouts": {},
+    }
+    for name, factory in layouts.items():
+        cases = []
+        for threads in thread_counts:
+            with tempfile.TemporaryDirectory() as tmp:
+                store = factory(Path(tmp))
+                try:
+                    _populate(store, session_ids, vectors, dimension, seed)
+                    cases.append(_run_load(store, session_ids, dimension, threads, duration, write_rate, seed))
+                finally:
+                    store.close()
+        results["layouts"][name] = cases
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=2000)
+    parser.add_argument("--dimension", type=int, default=64)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument(
+        "--write-rate",
+        type=float,
+        default=50.0,
+        help="Inserts per second from the background writer (0 disables it)",
+    )
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(
+        vectors=args.vectors,
+        dimension=args.dimension,
+        sessions=args.sessions,
+        thread_counts=args.threads,
+        duration=args.duration,
+        shards=args.shards,
+        write_rate=args.write_rate,
+        seed=args.seed,
+    )
+    results["environment"] = environment()
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ optional, and missing dependencies raise a clear and actionable error.
 """
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Sequence
@@ -92,6 +93,8 @@ class TFLiteEmbeddingModel(BaseEmbeddingModel):
             ) from exc
 
         self._interpreter = Interpreter(model_path=str(self.model_path))
+        # Interpreters keep per-invocation tensor state and must not be shared between threads.
+        self._lock = threading.Lock()
         if self.num_threads is not None:
             try:
                 self._interpreter.set_num_threads(self.num_threads)
@@ -116,12 +119,13 @@ class TFLiteEmbeddingModel(BaseEmbeddingModel):
             return []
 
         vectors: List[List[float]] = []
-        for text in texts:
-            input_tensor = np.array([text], dtype=np.object_)
-            self._interpreter.set_tensor(self._input_index, input_tensor)
-            self._interpreter.invoke()
-            output_tensor = self._interpreter.get_tensor(self._output_index)
-            vectors.append(output_tensor[0].tolist())
+        with self._lock:
+            for text in texts:
+                input_tensor = np.array([text], dtype=np.object_)
+                self._interpreter.set_tensor(self._input_index, input_tensor)
+                self._interpreter.invoke()
+                output_tensor = self._interpreter.get_tensor(self._output_index)
+                vectors.append(output_tensor[0].tolist())
         return vectors
 
 
@@ -5,6 +5,8 @@ import re
 import unicodedata
 from typing import List, Sequence
 
+from core.metrics.registry import EMBED_BATCH_SIZE, REGISTRY, STAGE_SECONDS
+
 from .model_loader import BaseEmbeddingModel
 
 _WHITESPACE_RE = re.compile(r"\s+")
@@ -33,8 +35,11 @@ class EmbeddingPipeline:
         else:
             texts_to_process = list(texts)
 
-        normalised = [normalise_text(text) for text in texts_to_process]
-        return self._model.embed(normalised)
+        with REGISTRY.time(STAGE_SECONDS, stage="normalise_text"):
+            normalised = [normalise_text(text) for text in texts_to_process]
+        REGISTRY.observe(EMBED_BATCH_SIZE, len(normalised))
+        with REGISTRY.time(STAGE_SECONDS, stage="embed"):
+            return self._model.embed(normalised)
 
 
 __all__ = ["EmbeddingPipeline", "normalise_text"]
@@ -0,0 +1,105 @@
+"""Background construction and warm-up of embedding models.
+
+Importing a runtime, building the inference session and running the first
+inference are the slowest steps of a cold start. ``BackgroundModelLoader``
+does all three on a daemon thread so the caller can start serving requests
+immediately and check ``ready`` (or ``wait``) before using the model.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Sequence
+
+from core.metrics.registry import REGISTRY, STAGE_SECONDS
+
+from .model_loader import BaseEmbeddingModel
+
+ModelFactory = Callable[[], BaseEmbeddingModel]
+
+DEFAULT_WARMUP_TEXTS: Sequence[str] = ("innervoice warm-up",)
+
+
+class BackgroundModelLoader:
+    """Build an embedding model on a daemon thread and push a dummy batch through it."""
+
+    IDLE = "idle"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        factory: ModelFactory,
+        warmup_texts: Sequence[str] = DEFAULT_WARMUP_TEXTS,
+        on_done: Callable[["BackgroundModelLoader"], None] | None = None,
+    ) -> None:
+        self._factory = factory
+        self._warmup_texts = list(warmup_texts)
+        self._on_done = on_done
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._model: BaseEmbeddingModel | None = None
+        self._error: BaseException | None = None
+        self._status = self.IDLE
+        self.timings: Dict[str, float] = {}
+
+    def start(self) -> "BackgroundModelLoader":
+        if self._thread is not None:
+            return self
+        self._status = self.LOADING
+        self._thread = threading.Thread(target=self._load, name="embedding-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def _load(self) -> None:
+        try:
+            started = time.perf_counter()
+            model = self._factory()
+            constructed = time.perf_counter()
+            if self._warmup_texts:
+                model.embed(self._warmup_texts)
+            warmed = time.perf_counter()
+        except BaseException as exc:  # noqa: BLE001 - surfaced through ``error``
+            self._error = exc
+            self._status = self.FAILED
+        else:
+            self.timings = {
+                "construct_s": round(constructed - started, 4),
+                "warmup_s": round(warmed - constructed, 4),
+            }
+            REGISTRY.observe(STAGE_SECONDS, constructed - started, stage="model_construct")
+            REGISTRY.observe(STAGE_SECONDS, warmed - constructed, stage="model_warmup")
+            self._model = model
+            self._status = self.READY
+        finally:
+            self._done.set()
+            if self._on_done is not None:
+                self._on_done(self)
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @property
+    def ready(self) -> bool:
+        return self._status == self.READY
+
+    @property
+    def error(self) -> BaseException | None:
+        return self._error
+
+    @property
+    def model(self) -> BaseEmbeddingModel | None:
+        """The warmed model, or ``None`` while loading or after a failure."""
+
+        return self._model
+
+    def wait(self, timeout: float | None = None) -> BaseEmbeddingModel | None:
+        """Block until loading finished (or ``timeout`` elapsed) and return the model."""
+
+        self._done.wait(timeout)
+        return self._model
+
+
+__all__ = ["BackgroundModelLoader", "DEFAULT_WARMUP_TEXTS", "ModelFactory"]
@@ -0,0 +1,164 @@
+"""Dimension reduction for the first-pass scan of ``SQLiteVectorStore``.
+
+Two projections are supported:
+
+* ``prefix`` keeps the first ``target_dimension`` components, which is the
+  intended use of Matryoshka-style embedding models and needs no fitting.
+* ``pca`` centres vectors on the fitted mean and projects them onto the top
+  principal components. Fitting requires ``numpy``; applying a fitted
+  projection does not.
+
+Reduced vectors only pick candidates; scores returned to callers are always
+exact cosine similarities of the original vectors.
+
+Projections are fitted offline against an existing store::
+
+    python -m core.storage.reduction fit data/memory.sqlite --method pca --target 64
+    python -m core.storage.reduction clear data/memory.sqlite
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+PREFIX = "prefix"
+PCA = "pca"
+METHODS = (PREFIX, PCA)
+
+
+class ProjectionError(RuntimeError):
+    """Raised when a projection cannot be fitted or does not match the store."""
+
+
+@dataclass
+class Projection:
+    method: str
+    source_dimension: int
+    target_dimension: int
+    version: int = 0
+    mean: List[float] = field(default_factory=list)
+    components: List[List[float]] = field(default_factory=list)
+
+    def project(self, vector: Sequence[float]) -> List[float]:
+        if len(vector) != self.source_dimension:
+            raise ProjectionError(
+                f"Projection expects {self.source_dimension} dimensions, received {len(vector)}"
+            )
+        if self.method == PREFIX:
+            return list(vector[: self.target_dimension])
+        centred = [value - mean for value, mean in zip(vector, self.mean)]
+        return [sum(a * b for a, b in zip(component, centred)) for component in self.components]
+
+    def parameters(self) -> List[float]:
+        """Flatten mean and components for storage (empty for prefix projections)."""
+
+        flat = list(self.mean)
+        for component in self.components:
+            flat.extend(component)
+        return flat
+
+    @classmethod
+    def from_parameters(
+        cls,
+        method: str,
+        source_dimension: int,
+        target_dimension: int,
+        version: int,
+        parameters: Sequence[float],
+    ) -> "Projection":
+        projection = cls(method, source_dimension, target_dimension, version)
+        if method == PCA:
+            projection.mean = list(parameters[:source_dimension])
+            offset = source_dimension
+            projection.components = [
+                list(parameters[offset + index * source_dimension : offset + (index + 1) * source_dimension])
+                for index in range(target_dimension)
+            ]
+        return projection
+
+
+def prefix_projection(source_dimension: int, target_dimension: int) -> Projection:
+    _check_dimensions(source_dimension, target_dimension)
+    return Projection(PREFIX, source_dimension, target_dimension)
+
+
+def fit_pca(vectors: Sequence[Sequence[float]], target_dimension: int) -> Projection:
+    """Fit a PCA projection onto ``target_dimension`` components."""
+
+    if not vectors:
+        raise ProjectionError("Cannot fit a PCA projection without vectors")
+    source_dimension = len(vectors[0])
+    _check_dimensions(source_dimension, target_dimension)
+    if len(vectors) < target_dimension:
+        raise ProjectionError(
+            f"PCA to {target_dimension} dimensions needs at least {target_dimension} vectors, received {len(vectors)}"
+        )
+    try:
+        import numpy as np
+    except Exception as exc:  # pragma: no cover - exercised only when dependency missing
+        raise ProjectionError(
+            "numpy is required to fit PCA projections. Install `numpy` or use the prefix method."
+        ) from exc
+
+    matrix = np.asarray(vectors, dtype=np.float64)
+    mean = matrix.mean(axis=0)
+    # Right singular vectors of the centred data are the principal axes, ordered by variance.
+    _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+    components = vt[:target_dimension]
+    return Projection(
+        PCA,
+        source_dimension,
+        target_dimension,
+        mean=mean.tolist(),
+        components=components.tolist(),
+    )
+
+
+def _check_dimensions(source_dimension: int, target_dimension: int) -> None:
+    if not 0 < target_dimension < source_dimension:
+        raise ProjectionError(
+            f"Target dimension must be between 1 and {source_dimension - 1}, received {target_dimension}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    # Imported here because the store itself depends on this module.
+    from .sqlite_vector_store import SQLiteVectorStore
+
+    parser = argparse.ArgumentParser(description="Fit or clear the reduced-vector projection of a store")
+    parser.add_argument("command", choices=["fit", "clear"])
+    parser.add_argument("path", help="Path to the SQLite vector store")
+    parser.add_argument("--method", choices=METHODS, default=PCA)
+    parser.add_argument("--target", type=int, default=64, help="Reduced dimension")
+    parser.add_argument("--sample-size", type=int, default=10000, help="Vectors sampled for PCA fitting")
+    args = parser.parse_args(argv)
+
+    store = SQLiteVectorStore(args.path)
+    try:
+        if args.command == "clear":
+            store.clear_projection()
+            print("Projection cleared; searches are exact.")
+            return
+        projection = store.fit_projection(args.method, args.target, args.sample_size)
+        print(
+            f"Projection v{projection.version} active: {projection.method} "
+            f"{projection.source_dimension} -> {projection.target_dimension} dimensions"
+        )
+    finally:
+        store.close()
+
+
+__all__ = [
+    "METHODS",
+    "PCA",
+    "PREFIX",
+    "Projection",
+    "ProjectionError",
+    "fit_pca",
+    "prefix_projection",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""Columnar snapshots for moving vector stores between devices and replicas.
+
+A snapshot is a directory with three files:
+
+* ``vectors.npy`` – one contiguous little-endian float32 matrix in NumPy's
+  ``.npy`` format (loadable with ``numpy.load(..., mmap_mode="r")``),
+* ``records.jsonl`` – one ``[id, session_id, metadata_json]`` line per row,
+  in the same order as the matrix,
+* ``manifest.json`` – dimension, row count, sessions and a SHA-256 checksum
+  per chunk of both files.
+
+Both files are written and verified chunk by chunk, so neither export nor
+import ever holds more than one chunk in memory. Vectors are copied as raw
+bytes; no float conversion happens on the export side.
+
+Usage::
+
+    python -m core.storage.snapshot export data/memory.sqlite backup/ [--session ID]
+    python -m core.storage.snapshot import data/memory.sqlite backup/ [--session ID]
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, Tuple
+
+FORMAT = "innervoice-vector-snapshot"
+FORMAT_VERSION = 1
+VECTORS_FILE = "vectors.npy"
+RECORDS_FILE = "records.jsonl"
+MANIFEST_FILE = "manifest.json"
+DEFAULT_CHUNK_ROWS = 4096
+
+_NPY_MAGIC = b"\x93NUMPY"
+_NPY_ALIGNMENT = 64
+
+# (id, session_id, little-endian float32 vector bytes, metadata JSON or None)
+SnapshotRow = Tuple[str, str, bytes, "str | None"]
+
+
+class SnapshotError(RuntimeError):
+    """Raised when a snapshot is malformed, truncated or fails its checksums."""
+
+
+@dataclass
+class SnapshotChunk:
+    records: List[Tuple[str, str, "str | None"]]
+    vectors: bytes
+
+
+def _npy_header(rows: int, dimension: int) -> bytes:
+    header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({rows}, {dimension}), }}"
+    # Magic (6) + version (2) + header length (2) + header + newline, padded to 64 bytes.
+    unpadded = len(_NPY_MAGIC) + 2 + 2 + len(header) + 1
+    header += " " * (-unpadded % _NPY_ALIGNMENT) + "\n"
+    return _NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _read_npy_header(handle: BinaryIO) -> Tuple[int, int]:
+    if handle.read(len(_NPY_MAGIC)) != _NPY_MAGIC:
+        raise SnapshotError(f"{VECTORS_FILE} is not an .npy file")
+    major, _minor = handle.read(2)
+    if major == 1:
+        (length,) = struct.unpack("<H", handle.read(2))
+    elif major in (2, 3):
+        (length,) = struct.unpack("<I", handle.read(4))
+    else:
+        raise SnapshotError(f"Unsupported .npy version {major}")
+    try:
+        header = ast.literal_eval(handle.read(length).decode("latin1"))
+    except (ValueError, SyntaxError) as exc:
+        raise SnapshotError(f"Corrupt {VECTORS_FILE} header") from exc
+    if header.get("descr") != "<f4" or header.get("fortran_order"):
+        raise SnapshotError(f"{VECTORS_FILE} must hold a C-ordered little-endian float32 matrix")
+    shape = header.get("shape")
+    if not isinstance(shape, tuple) or len(shape) != 2:
+        raise SnapshotError(f"{VECTORS_FILE} must hold a two-dimensional matrix")
+    return shape
+
+
+def write_snapshot(
+    directory: str | Path,
+    rows: Iterable[SnapshotRow],
+    count: int,
+    dimension: int,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> dict:
+    """Stream ``count`` rows into a snapshot directory and return its manifest."""
+
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    row_bytes = dimension * 4
+    chunks: List[dict] = []
+    sessions: set = set()
+    written = 0
+
+    def flush(vector_parts: List[bytes], record_parts: List[bytes]) -> None:
+        vectors = b"".join(vector_parts)
+        records = b"".join(record_parts)
+        vectors_out.write(vectors)
+        records_out.write(records)
+        chunks.append(
+            {
+                "rows": len(record_parts),
+                "vectorsSha256": hashlib.sha256(vectors).hexdigest(),
+                "recordsSha256": hashlib.sha256(records).hexdigest(),
+            }
+        )
+
+    with open(target / VECTORS_FILE, "wb") as vectors_out, open(target / RECORDS_FILE, "wb") as records_out:
+        vectors_out.write(_npy_header(count, dimension))
+        vector_parts: List[bytes] = []
+        record_parts: List[bytes] = []
+        for vector_id, session_id, blob, metadata_json in rows:
+            if len(blob) != row_bytes:
+                raise SnapshotError(
+                    f"Vector {vector_id} has {len(blob) // 4} dimensions, expected {dimension}"
+                )
+            vector_parts.append(blob)
+            record_parts.append(
+                json.dumps([vector_id, session_id, metadata_json], ensure_ascii=False).encode("utf-8") + b"\n"
+            )
+            sessions.add(session_id)
+            written += 1
+            if len(record_parts) == chunk_rows:
+                flush(vector_parts, record_parts)
+                vector_parts, record_parts = [], []
+        if record_parts:
+            flush(vector_parts, record_parts)
+
+    if written != count:
+        raise SnapshotError(f"Expected to export {count} rows, received {written}")
+
+    manifest = {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "dimension": dimension,
+        "count": count,
+        "sessions": sorted(sessions),
+        "chunkRows": chunk_rows,
+        "chunks": chunks,
+    }
+    (target / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def read_manifest(directory: str | Path) -> dict:
+    try:
+        manifest = json.loads((Path(directory) / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise SnapshotError(f"Cannot read {MANIFEST_FILE} in {directory!s}") from exc
+    if manifest.get("format") != FORMAT or manifest.get("version") != FORMAT_VERSION:
+        raise SnapshotError("Unsupported snapshot format or version")
+    return manifest
+
+
+def _count_lines(handle: BinaryIO) -> int:
+    lines = 0
+    last = b"\n"
+    for block in iter(lambda: handle.read(1 << 20), b""):
+        lines += block.count(b"\n")
+        last = block[-1:]
+    # An unterminated last line still counts, so trailing garbage is caught.
+    return lines if last == b"\n" else lines + 1
+
+
+def read_snapshot(directory: str | Path, manifest: dict) -> Iterator[SnapshotChunk]:
+    """Yield verified chunks; raises ``SnapshotError`` on the first mismatch.
+
+    Row counts and file sizes are checked against the manifest before the
+    first chunk is yielded, so a snapshot with extra or missing rows is
+    rejected up front rather than after a partial read.
+    """
+
+    source = Path(directory)
+    count = manifest["count"]
+    dimension = manifest["dimension"]
+    row_bytes = dimension * 4
+    if sum(chunk["rows"] for chunk in manifest["chunks"]) != count:
+        raise SnapshotError("Chunk row counts do not add up to the manifest count")
+    with open(source / VECTORS_FILE, "rb") as vectors_in, open(source / RECORDS_FILE, "rb") as records_in:
+        if _read_npy_header(vectors_in) != (count, dimension):
+            raise SnapshotError(f"{VECTORS_FILE} shape does not match the manifest")
+        if os.fstat(vectors_in.fileno()).st_size - vectors_in.tell() != count * row_bytes:
+            raise SnapshotError(f"{VECTORS_FILE} size does not match the manifest")
+        if _count_lines(records_in) != count:
+            raise SnapshotError(f"{RECORDS_FILE} does not hold exactly {count} records")
+        records_in.seek(0)
+        for index, chunk in enumerate(manifest["chunks"]):
+            rows = chunk["rows"]
+            vectors = vectors_in.read(rows * row_bytes)
+            lines = [records_in.readline() for _ in range(rows)]
+            if len(vectors) != rows * row_bytes or not all(line.endswith(b"\n") for line in lines):
+                raise SnapshotError(f"Snapshot is truncated in chunk {index}")
+            if hashlib.sha256(vectors).hexdigest() != chunk["vectorsSha256"]:
+                raise SnapshotError(f"Vector checksum mismatch in chunk {index}")
+            if hashlib.sha256(b"".join(lines)).hexdigest() != chunk["recordsSha256"]:
+                raise SnapshotError(f"Record checksum mismatch in chunk {index}")
+            records = [tuple(json.loads(line)) for line in lines]
+            yield SnapshotChunk(records=records, vectors=vectors)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    from .sqlite_vector_store import SQLiteVectorStore
+
+    parser = argparse.ArgumentParser(description="Export or import a vector store snapshot")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("store", help="Path to the SQLite vector store")
+    parser.add_argument("snapshot", help="Snapshot directory")
+    parser.add_argument(
+        "--session",
+        help="export: only this session; import: load every row into this session",
+    )
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    store = SQLiteVectorStore(args.store)
+    try:
+        if args.command == "export":
+            manifest = store.export_snapshot(args.snapshot, session_id=args.session, chunk_rows=args.chunk_rows)
+            print(f"Exported {manifest['count']} vectors from {len(manifest['sessions'])} session(s)")
+        else:
+            count = store.import_snapshot(args.snapshot, session_id=args.session)
+            print(f"Imported {count} vectors")
+    finally:
+        store.close()
+
+
+__all__ = [
+    "DEFAULT_CHUNK_ROWS",
+    "SnapshotChunk",
+    "SnapshotError",
+    "SnapshotRow",
+    "read_manifest",
+    "read_snapshot",
+    "write_snapshot",
+]
+
+
+if __name__ == "__main__":
+    main()
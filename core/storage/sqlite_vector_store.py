@@ -1,21 +1,49 @@
-"""SQLite backed vector store with per-session indices."""
+"""SQLite backed vector store with per-session indices.
+
+File backed stores run in WAL mode so that readers never block on the writer:
+all mutations go through a single writer connection guarded by a lock, while
+``search`` borrows a connection from a small pool of read-only connections.
+In-memory stores cannot share their database between connections, so they
+fall back to serialising every operation on the writer connection.
+
+Stores can optionally keep a reduced copy of every vector (see
+``core.storage.reduction``). ``search`` then scans the reduced vectors to pick
+candidates and re-ranks those with exact cosine similarity.
+
+``export_snapshot``/``import_snapshot`` move sessions or whole stores as
+columnar snapshots (see ``core.storage.snapshot``) without re-embedding.
+"""
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+import queue
 import sqlite3
 import string
 import sys
+import threading
 import uuid
 from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from itertools import zip_longest
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence, Set
+
+from core.metrics.registry import REGISTRY, SQLITE_QUERY_SECONDS, STAGE_SECONDS, record_cache
+
+from .reduction import PCA, PREFIX, Projection, ProjectionError, fit_pca, prefix_projection
+from .snapshot import DEFAULT_CHUNK_ROWS, read_manifest, read_snapshot, write_snapshot
 
 
 Vector = Sequence[float]
 
+_MEMORY_PATH = ":memory:"
+_BUSY_TIMEOUT_MS = 5000
+_REDUCTION_BATCH = 1000
+_MIN_CANDIDATES = 20
+
 
 def _vector_to_blob(vector: Vector) -> bytes:
     arr = array("f", vector)
@@ -32,6 +60,11 @@ def _blob_to_vector(blob: bytes) -> List[float]:
     return list(arr)
 
 
+def _imported_id(session_id: str, vector_id: str) -> str:
+    # Stable per (target session, original id): re-importing replaces instead of duplicating.
+    return hashlib.blake2b(f"{session_id}\0{vector_id}".encode("utf-8"), digest_size=16).hexdigest()
+
+
 def _normalise_session_id(session_id: str) -> str:
     safe_chars = string.ascii_letters + string.digits + "_"
     normalised = [char if char in safe_chars else "_" for char in session_id]
@@ -46,12 +79,33 @@ class SearchResult:
 
 
 class SQLiteVectorStore:
-    """Persist embeddings and perform cosine similarity search."""
+    """Persist embeddings and perform cosine similarity search.
 
-    def __init__(self, path: str | Path = ":memory:", dimension: int | None = None) -> None:
+    The store is safe to share between threads. ``read_pool_size`` bounds the
+    number of read-only connections that concurrent ``search`` calls may hold.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = _MEMORY_PATH,
+        dimension: int | None = None,
+        read_pool_size: int = 4,
+    ) -> None:
+        if read_pool_size < 1:
+            raise ValueError("read_pool_size must be >= 1")
         self._path = Path(path)
+        self._in_memory = str(path) == _MEMORY_PATH
         self._dimension = dimension
-        self._connection = sqlite3.connect(self._path)
+        self._write_lock = threading.RLock()
+        self._known_sessions: Set[str] = set()
+        self._connection = sqlite3.connect(
+            self._path,
+            timeout=_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+        )
+        if not self._in_memory:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
         self._connection.execute(
             """
             CREATE TABLE IF NOT EXISTS embeddings (
@@ -66,20 +120,212 @@ class SQLiteVectorStore:
         self._connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_embeddings_session ON embeddings(session_id)"
         )
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(embeddings)")}
+        for column, column_type in (("reduced", "BLOB"), ("reduced_norm", "REAL"), ("projection_version", "INTEGER")):
+            if column not in columns:
+                self._connection.execute(f"ALTER TABLE embeddings ADD COLUMN {column} {column_type}")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS projections (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                method TEXT NOT NULL,
+                source_dimension INTEGER NOT NULL,
+                target_dimension INTEGER NOT NULL,
+                parameters BLOB NOT NULL,
+                active INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT DEFAULT (datetime('now'))
+            )
+            """
+        )
         self._connection.commit()
+        self._projection = self._load_projection(self._connection)
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(read_pool_size)
+        self._all_readers: List[sqlite3.Connection] = []
+        self._closed = False
 
     def close(self) -> None:
-        self._connection.close()
+        with self._write_lock:
+            if self._closed:
+                return
+            self._closed = True
+            for reader in self._all_readers:
+                reader.close()
+            self._all_readers.clear()
+            self._connection.close()
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{self._path.resolve().as_uri()}?mode=ro"
+        reader = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+        )
+        reader.execute("PRAGMA query_only=ON")
+        return reader
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        if self._in_memory:
+            # Separate connections to ":memory:" see separate databases.
+            with self._write_lock:
+                yield self._connection
+            return
+
+        self._reader_slots.acquire()
+        try:
+            try:
+                reader = self._readers.get_nowait()
+                record_cache("vector_reader_pool", hit=True)
+            except queue.Empty:
+                record_cache("vector_reader_pool", hit=False)
+                reader = self._open_reader()
+                with self._write_lock:
+                    self._all_readers.append(reader)
+            try:
+                yield reader
+            finally:
+                self._readers.put(reader)
+        finally:
+            self._reader_slots.release()
+
+    def count(self, session_id: str | None = None) -> int:
+        """Number of stored vectors, optionally restricted to one session."""
+
+        with self._reader() as connection:
+            if session_id is None:
+                return connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return connection.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+
+    @staticmethod
+    def _active_version(connection: sqlite3.Connection) -> int | None:
+        row = connection.execute("SELECT MAX(version) FROM projections WHERE active = 1").fetchone()
+        return row[0] if row else None
+
+    def _load_projection(self, connection: sqlite3.Connection) -> Projection | None:
+        row = connection.execute(
+            "SELECT version, method, source_dimension, target_dimension, parameters "
+            "FROM projections WHERE active = 1 ORDER BY version DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        version, method, source_dimension, target_dimension, parameters = row
+        return Projection.from_parameters(
+            method, source_dimension, target_dimension, version, _blob_to_vector(parameters)
+        )
+
+    @property
+    def projection(self) -> Projection | None:
+        """The projection used for first-pass scans, or ``None`` for exact search only."""
+
+        return self._projection
+
+    def fit_projection(
+        self,
+        method: str = PCA,
+        target_dimension: int = 64,
+        sample_size: int = 10000,
+    ) -> Projection:
+        """Fit a new projection version, reduce every stored vector with it and activate it.
+
+        This rewrites the whole table in one transaction and is meant to run
+        offline; concurrent searches keep using the previous version until it
+        commits.
+        """
+
+        with self._write_lock:
+            if method == PREFIX:
+                if self._dimension is None:
+                    row = self._connection.execute("SELECT vector FROM embeddings LIMIT 1").fetchone()
+                    if row is None:
+                        raise ProjectionError("Cannot infer the embedding dimension of an empty store")
+                    self._dimension = len(_blob_to_vector(row[0]))
+                projection = prefix_projection(self._dimension, target_dimension)
+            elif method == PCA:
+                rows = self._connection.execute(
+                    "SELECT vector FROM embeddings ORDER BY random() LIMIT ?",
+                    (sample_size,),
+                ).fetchall()
+                projection = fit_pca([_blob_to_vector(blob) for (blob,) in rows], target_dimension)
+            else:
+                raise ProjectionError(f"Unsupported projection method: {method}")
+
+            try:
+                cursor = self._connection.execute(
+                    "INSERT INTO projections(method, source_dimension, target_dimension, parameters) VALUES (?, ?, ?, ?)",
+                    (
+                        projection.method,
+                        projection.source_dimension,
+                        projection.target_dimension,
+                        _vector_to_blob(projection.parameters()),
+                    ),
+                )
+                projection.version = cursor.lastrowid
+                last_rowid = 0
+                while True:
+                    batch = self._connection.execute(
+                        "SELECT rowid, vector FROM embeddings WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                        (last_rowid, _REDUCTION_BATCH),
+                    ).fetchall()
+                    if not batch:
+                        break
+                    updates = []
+                    for rowid, blob in batch:
+                        reduced, reduced_norm = self._reduce(projection, _blob_to_vector(blob))
+                        updates.append((reduced, reduced_norm, projection.version, rowid))
+                    self._connection.executemany(
+                        "UPDATE embeddings SET reduced = ?, reduced_norm = ?, projection_version = ? WHERE rowid = ?",
+                        updates,
+                    )
+                    last_rowid = batch[-1][0]
+                self._connection.execute("UPDATE projections SET active = (version = ?)", (projection.version,))
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
+            self._projection = projection
+        return projection
+
+    def clear_projection(self) -> None:
+        """Deactivate dimension reduction; searches fall back to exact scans."""
+
+        with self._write_lock:
+            try:
+                self._connection.execute("UPDATE projections SET active = 0")
+                self._connection.execute(
+                    "UPDATE embeddings SET reduced = NULL, reduced_norm = NULL, projection_version = NULL"
+                )
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
+            self._projection = None
+
+    @staticmethod
+    def _reduce(projection: Projection, vector: Vector) -> tuple[bytes, float]:
+        reduced = projection.project(vector)
+        return _vector_to_blob(reduced), math.sqrt(sum(value * value for value in reduced))
 
     def _ensure_dimension(self, vector: Vector) -> None:
         if self._dimension is None:
-            self._dimension = len(vector)
-        elif len(vector) != self._dimension:
+            with self._write_lock:
+                if self._dimension is None:
+                    self._dimension = len(vector)
+        if len(vector) != self._dimension:
             raise ValueError(
                 f"Embedding dimensionality mismatch: expected {self._dimension}, received {len(vector)}"
             )
 
     def _ensure_session_index(self, session_id: str) -> None:
+        # Callers hold the write lock; the index only has to be created once per process.
+        known = session_id in self._known_sessions
+        record_cache("vector_session_index", hit=known)
+        if known:
+            return
         normalised = _normalise_session_id(session_id)
         index_name = f"idx_embeddings_{normalised}"
         query = (
@@ -92,29 +338,48 @@ class SQLiteVectorStore:
         escaped_session = session_id.replace("'", "''")
         query_inlined = query.replace("?", f"'{escaped_session}'")
         self._connection.execute(query_inlined)
-        self._connection.commit()
+        self._known_sessions.add(session_id)
 
-    def add_vector(
+    def _insert(
         self,
         session_id: str,
         vector: Vector,
-        metadata: dict | None = None,
-        vector_id: str | None = None,
+        metadata: dict | None,
+        vector_id: str | None,
     ) -> str:
         self._ensure_dimension(vector)
-        self._ensure_session_index(session_id)
-
         if vector_id is None:
             vector_id = uuid.uuid4().hex
 
         blob = _vector_to_blob(vector)
         norm = math.sqrt(sum(value * value for value in vector))
         metadata_json = json.dumps(metadata) if metadata is not None else None
+        reduced, reduced_norm, version = None, None, None
+        if self._projection is not None:
+            reduced, reduced_norm = self._reduce(self._projection, vector)
+            version = self._projection.version
         self._connection.execute(
-            "INSERT OR REPLACE INTO embeddings(id, session_id, vector, norm, metadata) VALUES (?, ?, ?, ?, ?)",
-            (vector_id, session_id, blob, norm, metadata_json),
+            "INSERT OR REPLACE INTO embeddings(id, session_id, vector, norm, metadata, reduced, reduced_norm, "
+            "projection_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (vector_id, session_id, blob, norm, metadata_json, reduced, reduced_norm, version),
         )
-        self._connection.commit()
+        return vector_id
+
+    def add_vector(
+        self,
+        session_id: str,
+        vector: Vector,
+        metadata: dict | None = None,
+        vector_id: str | None = None,
+    ) -> str:
+        with self._write_lock, REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="insert"):
+            try:
+                self._ensure_session_index(session_id)
+                vector_id = self._insert(session_id, vector, metadata, vector_id)
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
         return vector_id
 
     def add_many(
@@ -123,34 +388,228 @@ class SQLiteVectorStore:
         vectors: Iterable[Vector],
         metadatas: Iterable[dict | None] | None = None,
     ) -> List[str]:
-        ids: List[str] = []
+        """Insert several vectors for ``session_id`` in a single transaction."""
+
         if metadatas is None:
-            for vector in vectors:
-                ids.append(self.add_vector(session_id, vector, None))
+            pairs: Iterable = ((vector, None) for vector in vectors)
         else:
-            for vector, metadata in zip_longest(vectors, metadatas, fillvalue=None):
-                if vector is None:  # metadatas longer than vectors
-                    break
-                ids.append(self.add_vector(session_id, vector, metadata))
+            pairs = zip_longest(vectors, metadatas, fillvalue=None)
+
+        ids: List[str] = []
+        with self._write_lock, REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="insert_many"):
+            try:
+                self._ensure_session_index(session_id)
+                for vector, metadata in pairs:
+                    if vector is None:  # metadatas longer than vectors
+                        break
+                    ids.append(self._insert(session_id, vector, metadata, None))
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
         return ids
 
+    def export_snapshot(
+        self,
+        directory: str | Path,
+        session_id: str | None = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> dict:
+        """Write one session (or the whole store) as a snapshot and return its manifest."""
+
+        where, params = ("WHERE session_id = ?", (session_id,)) if session_id is not None else ("", ())
+        with self._reader() as connection, REGISTRY.time(
+            SQLITE_QUERY_SECONDS, store="vectors", operation="export"
+        ):
+            # One read transaction keeps the row count and the streamed rows consistent.
+            connection.execute("BEGIN")
+            try:
+                count = connection.execute(f"SELECT COUNT(*) FROM embeddings {where}", params).fetchone()[0]
+                dimension = self._dimension
+                if dimension is None:
+                    row = connection.execute(
+                        f"SELECT length(vector) FROM embeddings {where} LIMIT 1", params
+                    ).fetchone()
+                    dimension = row[0] // 4 if row else 0
+                cursor = connection.execute(
+                    f"SELECT id, session_id, vector, metadata FROM embeddings {where} ORDER BY rowid", params
+                )
+                return write_snapshot(directory, cursor, count, dimension, chunk_rows)
+            finally:
+                connection.execute("ROLLBACK")
+
+    def import_snapshot(self, directory: str | Path, session_id: str | None = None) -> int:
+        """Bulk-load a snapshot in a single transaction and return the number of rows.
+
+        ``session_id`` loads every row into that session instead of the
+        sessions recorded in the snapshot. Rows then get an id derived from
+        the session and their original id, so other sessions' rows are never
+        moved and re-running the same import is idempotent. Without it,
+        existing rows with the same id are replaced.
+        Nothing is written, and the store's dimension and session indexes are
+        left untouched, if any chunk fails verification.
+        """
+
+        manifest = read_manifest(directory)
+        dimension = manifest["dimension"]
+        row_bytes = dimension * 4
+        imported = 0
+        with self._write_lock, REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="import"):
+            if manifest["count"] and self._dimension is not None and dimension != self._dimension:
+                raise ValueError(
+                    f"Embedding dimensionality mismatch: expected {self._dimension}, snapshot has {dimension}"
+                )
+            projection = self._projection
+            try:
+                for chunk in read_snapshot(directory, manifest):
+                    params = []
+                    for index, (vector_id, row_session, metadata_json) in enumerate(chunk.records):
+                        blob = chunk.vectors[index * row_bytes : (index + 1) * row_bytes]
+                        vector = _blob_to_vector(blob)
+                        norm = math.sqrt(sum(value * value for value in vector))
+                        reduced, reduced_norm, version = None, None, None
+                        if projection is not None:
+                            reduced, reduced_norm = self._reduce(projection, vector)
+                            version = projection.version
+                        params.append(
+                            (
+                                vector_id if session_id is None else _imported_id(session_id, vector_id),
+                                session_id if session_id is not None else row_session,
+                                blob,
+                                norm,
+                                metadata_json,
+                                reduced,
+                                reduced_norm,
+                                version,
+                            )
+                        )
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings(id, session_id, vector, norm, metadata, reduced, "
+                        "reduced_norm, projection_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        params,
+                    )
+                    imported += len(params)
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
+            # Index DDL autocommits, so it only runs once the rows are in.
+            if imported:
+                if self._dimension is None:
+                    self._dimension = dimension
+                for session in [session_id] if session_id is not None else manifest["sessions"]:
+                    self._ensure_session_index(session)
+        return imported
+
     def search(
         self,
         session_id: str,
         query_vector: Vector,
         top_k: int = 5,
+        candidates: int | None = None,
+        exact: bool = False,
+    ) -> List[SearchResult]:
+        """Return the ``top_k`` most similar vectors of ``session_id``.
+
+        With an active projection, ``candidates`` vectors (default
+        ``max(4 * top_k, 20)``) are picked on the reduced vectors and re-ranked
+        exactly. ``candidates`` below ``top_k`` is raised to ``top_k`` so the
+        first pass never returns fewer results than requested. ``exact=True``
+        skips the first pass.
+        """
+
+        with REGISTRY.time(STAGE_SECONDS, stage="search"):
+            return self._search(session_id, query_vector, top_k, candidates, exact)
+
+    def _search(
+        self,
+        session_id: str,
+        query_vector: Vector,
+        top_k: int,
+        candidates: int | None,
+        exact: bool,
     ) -> List[SearchResult]:
         self._ensure_dimension(query_vector)
         query_norm = math.sqrt(sum(value * value for value in query_vector))
         if query_norm == 0:
             raise ValueError("Query vector norm must be > 0")
 
-        cursor = self._connection.execute(
-            "SELECT id, vector, norm, metadata FROM embeddings WHERE session_id = ?",
-            (session_id,),
-        )
+        with self._reader() as connection:
+            projection = self._projection
+            active_version = self._active_version(connection)
+            if active_version != (projection.version if projection is not None else None):
+                # Another connection or process refitted the projection.
+                projection = self._load_projection(connection)
+                self._projection = projection
+            if projection is not None and not exact:
+                limit = max(candidates, top_k) if candidates is not None else max(4 * top_k, _MIN_CANDIDATES)
+                rows = self._first_pass(connection, session_id, projection, query_vector, limit)
+            else:
+                rows = None
+            if rows is None:
+                with REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="search"):
+                    rows = connection.execute(
+                        "SELECT id, vector, norm, metadata FROM embeddings WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchall()
+
+        return self._score(rows, query_vector, query_norm)[:top_k]
+
+    def _first_pass(
+        self,
+        connection: sqlite3.Connection,
+        session_id: str,
+        projection: Projection,
+        query_vector: Vector,
+        limit: int,
+    ) -> list | None:
+        """Pick candidates on reduced vectors and fetch their full rows, or ``None`` to scan exactly."""
+
+        reduced_query = projection.project(query_vector)
+        reduced_query_norm = math.sqrt(sum(value * value for value in reduced_query))
+        if reduced_query_norm == 0:
+            return None
+
+        with REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="search_reduced"):
+            reduced_rows = connection.execute(
+                "SELECT id, reduced, reduced_norm, projection_version FROM embeddings WHERE session_id = ?",
+                (session_id,),
+            ).fetchall()
+
+        approximate: List[tuple[float, str]] = []
+        stale: List[str] = []
+        for vector_id, blob, norm, version in reduced_rows:
+            if version != projection.version:
+                stale.append(vector_id)  # not reduced with this projection yet, always re-rank
+                continue
+            if not norm:
+                continue
+            reduced = _blob_to_vector(blob)
+            dot = sum(a * b for a, b in zip(reduced_query, reduced))
+            approximate.append((dot / (reduced_query_norm * norm), vector_id))
+        approximate.sort(reverse=True)
+        selected = [vector_id for _, vector_id in approximate[:limit]] + stale
+        if not selected:
+            return []
+
+        with REGISTRY.time(SQLITE_QUERY_SECONDS, store="vectors", operation="search_rerank"):
+            rows: list = []
+            # Stay well below SQLite's bound-parameter limit.
+            for offset in range(0, len(selected), 500):
+                chunk = selected[offset : offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    connection.execute(
+                        f"SELECT id, vector, norm, metadata FROM embeddings WHERE id IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return rows
+
+    @staticmethod
+    def _score(rows: Iterable, query_vector: Vector, query_norm: float) -> List[SearchResult]:
         candidates: List[SearchResult] = []
-        for vector_id, blob, norm, metadata_json in cursor.fetchall():
+        for vector_id, blob, norm, metadata_json in rows:
             if norm == 0:
                 continue
             vector = _blob_to_vector(blob)
@@ -159,7 +618,91 @@ class SQLiteVectorStore:
             metadata = json.loads(metadata_json) if metadata_json else None
             candidates.append(SearchResult(vector_id=vector_id, score=score, metadata=metadata))
         candidates.sort(key=lambda item: item.score, reverse=True)
-        return candidates[:top_k]
+        return candidates
+
+
+class ShardedSQLiteVectorStore:
+    """Spread sessions over several ``SQLiteVectorStore`` files.
+
+    Sessions are assigned to a shard by a stable hash of their id, so two
+    sessions on different shards never contend for the same writer lock or
+    database file.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        shards: int = 4,
+        dimension: int | None = None,
+        read_pool_size: int = 4,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._shards: List[SQLiteVectorStore] = [
+            SQLiteVectorStore(
+                self._directory / f"shard_{index:02d}.sqlite",
+                dimension=dimension,
+                read_pool_size=read_pool_size,
+            )
+            for index in range(shards)
+        ]
+
+    @property
+    def shards(self) -> List[SQLiteVectorStore]:
+        return list(self._shards)
+
+    def shard_for(self, session_id: str) -> SQLiteVectorStore:
+        digest = hashlib.blake2b(session_id.encode("utf-8"), digest_size=8).digest()
+        return self._shards[int.from_bytes(digest, "little") % len(self._shards)]
+
+    def close(self) -> None:
+        for shard in self._shards:
+            shard.close()
+
+    def add_vector(
+        self,
+        session_id: str,
+        vector: Vector,
+        metadata: dict | None = None,
+        vector_id: str | None = None,
+    ) -> str:
+        return self.shard_for(session_id).add_vector(session_id, vector, metadata, vector_id)
+
+    def add_many(
+        self,
+        session_id: str,
+        vectors: Iterable[Vector],
+        metadatas: Iterable[dict | None] | None = None,
+    ) -> List[str]:
+        return self.shard_for(session_id).add_many(session_id, vectors, metadatas)
+
+    def search(
+        self,
+        session_id: str,
+        query_vector: Vector,
+        top_k: int = 5,
+        candidates: int | None = None,
+        exact: bool = False,
+    ) -> List[SearchResult]:
+        return self.shard_for(session_id).search(
+            session_id, query_vector, top_k=top_k, candidates=candidates, exact=exact
+        )
+
+    def fit_projection(
+        self,
+        method: str = PCA,
+        target_dimension: int = 64,
+        sample_size: int = 10000,
+    ) -> List[Projection]:
+        """Fit one projection per shard; shards without vectors are skipped."""
+
+        return [
+            shard.fit_projection(method, target_dimension, sample_size)
+            for shard in self._shards
+            if shard.count()
+        ]
 
 
-__all__ = ["SQLiteVectorStore", "SearchResult"]
+__all__ = ["SQLiteVectorStore", "ShardedSQLiteVectorStore", "SearchResult"]
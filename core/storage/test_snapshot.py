@@ -0,0 +1,90 @@
+"""Regression tests for snapshot export/import of ``SQLiteVectorStore``.
+
+Run with ``python -m pytest core/storage`` or ``python -m unittest core.storage.test_snapshot``.
+"""
+from __future__ import annotations
+
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from .snapshot import RECORDS_FILE, VECTORS_FILE, SnapshotError
+from .sqlite_vector_store import SQLiteVectorStore
+
+_DIMENSION = 8
+
+
+def _vectors(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1.0, 1.0) for _ in range(_DIMENSION)] for _ in range(count)]
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.source = SQLiteVectorStore()
+        self.addCleanup(self.source.close)
+        self.vectors = _vectors(12)
+        self.metadatas = [{"text": f"entry {index}", "index": index} for index in range(len(self.vectors))]
+        self.ids = self.source.add_many("journal", self.vectors, self.metadatas)
+        self.snapshot = self.tmp / "snapshot"
+        # Several chunks, so corruption in a later chunk happens after earlier ones were inserted.
+        self.source.export_snapshot(self.snapshot, chunk_rows=5)
+
+    def _target(self) -> SQLiteVectorStore:
+        store = SQLiteVectorStore(self.tmp / "target.sqlite")
+        self.addCleanup(store.close)
+        return store
+
+    def test_round_trip_preserves_ids_and_metadata(self) -> None:
+        target = self._target()
+
+        self.assertEqual(target.import_snapshot(self.snapshot), len(self.vectors))
+
+        self.assertEqual(target.count("journal"), len(self.vectors))
+        for vector_id, vector, metadata in zip(self.ids, self.vectors, self.metadatas):
+            best = target.search("journal", vector, top_k=1, exact=True)[0]
+            self.assertEqual(best.vector_id, vector_id)
+            self.assertEqual(best.metadata, metadata)
+            self.assertAlmostEqual(best.score, 1.0, places=5)
+
+    def test_session_override_import_is_idempotent(self) -> None:
+        target = self._target()
+
+        target.import_snapshot(self.snapshot, session_id="restored")
+        target.import_snapshot(self.snapshot, session_id="restored")
+
+        self.assertEqual(target.count("restored"), len(self.vectors))
+        self.assertEqual(target.count("journal"), 0)
+
+    def test_corrupted_chunk_leaves_store_unchanged(self) -> None:
+        path = self.snapshot / VECTORS_FILE
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0x01
+        path.write_bytes(bytes(data))
+        target = self._target()
+
+        with self.assertRaises(SnapshotError):
+            target.import_snapshot(self.snapshot)
+
+        self.assertEqual(target.count(), 0)
+        # The snapshot's dimension must not have been adopted by the failed import.
+        target.add_vector("other", [0.5] * (_DIMENSION + 1))
+        self.assertEqual(target.count(), 1)
+
+    def test_trailing_record_line_is_rejected(self) -> None:
+        with open(self.snapshot / RECORDS_FILE, "a", encoding="utf-8") as handle:
+            handle.write('["extra", "journal", null]\n')
+        target = self._target()
+
+        with self.assertRaises(SnapshotError):
+            target.import_snapshot(self.snapshot)
+
+        self.assertEqual(target.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
+import argparse
 import os
 import sqlite3
+from collections import defaultdict
 from contextlib import contextmanager
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+from core.metrics.registry import REGISTRY, SQLITE_QUERY_SECONDS
 
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'interactions.sqlite')
 
@@ -39,12 +43,121 @@ class InteractionStore:
                 )
                 """
             )
+            # Rollups are keyed on '' instead of NULL moods so the primary keys stay unique.
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS interaction_daily_rollup (
+                    day TEXT NOT NULL,
+                    persona_slug TEXT NOT NULL,
+                    mood TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    confidence_sum REAL NOT NULL,
+                    confidence_count INTEGER NOT NULL,
+                    PRIMARY KEY (day, persona_slug, mood)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS interaction_persona_totals (
+                    persona_slug TEXT NOT NULL,
+                    mood TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    confidence_sum REAL NOT NULL,
+                    confidence_count INTEGER NOT NULL,
+                    PRIMARY KEY (persona_slug, mood)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS interaction_keyword_totals (
+                    keyword TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS interaction_rollup_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    last_id INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute("INSERT OR IGNORE INTO interaction_rollup_state (id, last_id) VALUES (1, 0)")
+            # Databases created before the rollups existed are caught up here, once.
+            self._apply_rollups(conn)
             conn.commit()
 
+    def _apply_rollups(self, conn: sqlite3.Connection) -> int:
+        """Fold every interaction newer than the rollup watermark into the rollup tables."""
+        last_id = conn.execute("SELECT last_id FROM interaction_rollup_state WHERE id = 1").fetchone()[0]
+        rows = conn.execute(
+            "SELECT id, date(created_at), persona_slug, mood, keywords, confidence "
+            "FROM interactions WHERE id > ? ORDER BY id",
+            (last_id,),
+        )
+        daily: Dict[Tuple[str, str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0])
+        keywords: Dict[str, int] = defaultdict(int)
+        newest = last_id
+        for row_id, day, persona_slug, mood, keyword_list, confidence in rows:
+            bucket = daily[(day, persona_slug, mood or '')]
+            bucket[0] += 1
+            if confidence is not None:
+                bucket[1] += confidence
+                bucket[2] += 1
+            for keyword in filter(None, (keyword_list or '').split(',')):
+                keywords[keyword] += 1
+            newest = row_id
+        if newest == last_id:
+            return 0
+
+        totals: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0])
+        for (_, persona_slug, mood), (count, confidence_sum, confidence_count) in daily.items():
+            total = totals[(persona_slug, mood)]
+            total[0] += count
+            total[1] += confidence_sum
+            total[2] += confidence_count
+
+        conn.executemany(
+            """
+            INSERT INTO interaction_daily_rollup (day, persona_slug, mood, count, confidence_sum, confidence_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (day, persona_slug, mood) DO UPDATE SET
+                count = count + excluded.count,
+                confidence_sum = confidence_sum + excluded.confidence_sum,
+                confidence_count = confidence_count + excluded.confidence_count
+            """,
+            [(*key, *values) for key, values in daily.items()],
+        )
+        conn.executemany(
+            """
+            INSERT INTO interaction_persona_totals (persona_slug, mood, count, confidence_sum, confidence_count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (persona_slug, mood) DO UPDATE SET
+                count = count + excluded.count,
+                confidence_sum = confidence_sum + excluded.confidence_sum,
+                confidence_count = confidence_count + excluded.confidence_count
+            """,
+            [(*key, *values) for key, values in totals.items()],
+        )
+        conn.executemany(
+            """
+            INSERT INTO interaction_keyword_totals (keyword, count) VALUES (?, ?)
+            ON CONFLICT (keyword) DO UPDATE SET count = count + excluded.count
+            """,
+            list(keywords.items()),
+        )
+        conn.execute("UPDATE interaction_rollup_state SET last_id = ? WHERE id = 1", (newest,))
+        return newest - last_id
+
     def log(self, user_message: str, state: dict, response: str) -> int:
         persona = state["persona"]
         keywords = ",".join(state.get("matched_keywords", []))
-        with self._connection() as conn:
+        with self._connection() as conn, REGISTRY.time(
+            SQLITE_QUERY_SECONDS, store="interactions", operation="log"
+        ):
             cursor = conn.execute(
                 """
                 INSERT INTO interactions (
@@ -62,14 +175,95 @@ class InteractionStore:
                     state.get("confidence"),
                 ),
             )
+            # Same transaction as the insert, so rollups never drift from the raw rows.
+            self._apply_rollups(conn)
             conn.commit()
             return cursor.lastrowid
 
     def fetch_recent(self, limit: int = 20) -> Iterable[sqlite3.Row]:
-        with self._connection() as conn:
+        with self._connection() as conn, REGISTRY.time(
+            SQLITE_QUERY_SECONDS, store="interactions", operation="fetch_recent"
+        ):
             cursor = conn.execute(
                 "SELECT id, created_at, user_message, persona_name, response, tone, mood, keywords, confidence "
                 "FROM interactions ORDER BY id DESC LIMIT ?",
                 (limit,),
             )
             return cursor.fetchall()
+
+    def rebuild_rollups(self) -> int:
+        """Recompute all rollup tables from the raw interactions and return the row count."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM interaction_daily_rollup")
+            conn.execute("DELETE FROM interaction_persona_totals")
+            conn.execute("DELETE FROM interaction_keyword_totals")
+            conn.execute("UPDATE interaction_rollup_state SET last_id = 0 WHERE id = 1")
+            self._apply_rollups(conn)
+            conn.commit()
+            return conn.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def fetch_stats(self, days: int = 30, keyword_limit: int = 10) -> Dict[str, object]:
+        """Summarise interactions from the rollup tables; cost does not grow with history."""
+        with self._connection() as conn, REGISTRY.time(
+            SQLITE_QUERY_SECONDS, store="interactions", operation="fetch_stats"
+        ):
+            totals = conn.execute(
+                "SELECT persona_slug, mood, count, confidence_sum, confidence_count FROM interaction_persona_totals"
+            ).fetchall()
+            keywords = conn.execute(
+                "SELECT keyword, count FROM interaction_keyword_totals ORDER BY count DESC, keyword LIMIT ?",
+                (keyword_limit,),
+            ).fetchall()
+            daily = conn.execute(
+                "SELECT day, persona_slug, mood, count, confidence_sum, confidence_count "
+                "FROM interaction_daily_rollup WHERE day > date('now', ?) ORDER BY day",
+                (f"-{int(days)} days",),
+            ).fetchall()
+
+        personas: Dict[str, int] = defaultdict(int)
+        moods: Dict[str, int] = defaultdict(int)
+        confidence_sum = 0.0
+        confidence_count = 0
+        for row in totals:
+            personas[row['persona_slug']] += row['count']
+            if row['mood']:
+                moods[row['mood']] += row['count']
+            confidence_sum += row['confidence_sum']
+            confidence_count += row['confidence_count']
+
+        timeline: Dict[str, Dict[str, object]] = {}
+        day_confidence: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0])
+        for row in daily:
+            entry = timeline.setdefault(row['day'], {"day": row['day'], "count": 0, "personas": {}, "moods": {}})
+            entry["count"] += row['count']
+            entry["personas"][row['persona_slug']] = entry["personas"].get(row['persona_slug'], 0) + row['count']
+            if row['mood']:
+                entry["moods"][row['mood']] = entry["moods"].get(row['mood'], 0) + row['count']
+            day_confidence[row['day']][0] += row['confidence_sum']
+            day_confidence[row['day']][1] += row['confidence_count']
+        for day, entry in timeline.items():
+            conf_sum, conf_count = day_confidence[day]
+            entry["averageConfidence"] = round(conf_sum / conf_count, 3) if conf_count else None
+
+        return {
+            "total": sum(personas.values()),
+            "personas": dict(personas),
+            "moods": dict(moods),
+            "averageConfidence": round(confidence_sum / confidence_count, 3) if confidence_count else None,
+            "topKeywords": [{"keyword": row['keyword'], "count": row['count']} for row in keywords],
+            "days": list(timeline.values()),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Wartung der InnerVoice-Interaktionsdatenbank")
+    parser.add_argument('command', choices=['rebuild-rollups'])
+    parser.add_argument('--db', default=DB_PATH, help="Pfad zur SQLite-Datenbank")
+    args = parser.parse_args()
+    if args.command == 'rebuild-rollups':
+        rows = InteractionStore(args.db).rebuild_rollups()
+        print(f"Statistiken aus {rows} Interaktionen neu berechnet")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
+
+from core.embeddings.pipeline import EmbeddingPipeline
+from core.embeddings.warmup import BackgroundModelLoader
+from core.metrics.registry import REGISTRY
+from core.search.semantic import SemanticSearchEngine
+from core.storage.sqlite_vector_store import SQLiteVectorStore
+
+DEFAULT_BUDGET_MS = 150
+DEFAULT_TOP_K = 3
+DEFAULT_MIN_SCORE = 0.35
+DEFAULT_MAX_PENDING = 256
+DEFAULT_MAX_INDEX_BACKLOG = 64
+
+MEMORY_LOOKUPS = REGISTRY.counter(
+    "innervoice_memory_lookups_total",
+    "Semantic memory lookups on the respond path, by outcome.",
+    ("result",),
+)
+MEMORY_INDEX_REQUESTS = REGISTRY.counter(
+    "innervoice_memory_index_requests_total",
+    "Messages handed to background memory indexing, by outcome.",
+    ("result",),
+)
+
+
+class SemanticMemory:
+    """Retrieve past entries within a per-request budget and index new ones in the background.
+
+    Lookups run on a small thread pool so they overlap with persona resolution;
+    a lookup that misses its deadline is dropped and the caller carries on
+    without memories. Indexing uses its own single worker so a backlog of
+    writes can never delay lookups. Messages arriving while the model warms up
+    are held in a bounded queue and indexed once it is ready; beyond that, and
+    beyond ``max_index_backlog`` queued index tasks, messages are dropped and
+    counted.
+    """
+
+    def __init__(
+        self,
+        model_loader: BackgroundModelLoader,
+        store_path: str,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        top_k: int = DEFAULT_TOP_K,
+        min_score: float = DEFAULT_MIN_SCORE,
+        query_workers: int = 2,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_index_backlog: int = DEFAULT_MAX_INDEX_BACKLOG,
+    ) -> None:
+        self.model_loader = model_loader
+        self.store_path = store_path
+        os.makedirs(os.path.dirname(os.path.abspath(store_path)), exist_ok=True)
+        self.budget = budget_ms / 1000
+        self.top_k = top_k
+        self.min_score = min_score
+        self._engine: Optional[SemanticSearchEngine] = None
+        self._engine_lock = threading.Lock()
+        self._query_pool = ThreadPoolExecutor(max_workers=query_workers, thread_name_prefix="memory-query")
+        self._index_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-index")
+        self._index_slots = threading.BoundedSemaphore(max_index_backlog)
+        self._max_pending = max_pending
+        self._pending: List[Tuple[str, str]] = []
+        self._pending_lock = threading.Lock()
+
+    def _get_engine(self) -> Optional[SemanticSearchEngine]:
+        if self._engine is not None:
+            return self._engine
+        model = self.model_loader.model
+        if model is None:
+            return None
+        with self._engine_lock:
+            if self._engine is None:
+                self._engine = SemanticSearchEngine(EmbeddingPipeline(model), SQLiteVectorStore(self.store_path))
+                self._flush_pending(self._engine)
+        return self._engine
+
+    def deadline(self, started: float) -> float:
+        return started + self.budget
+
+    def start_lookup(self, session_id: str, message: str) -> Optional[Future]:
+        engine = self._get_engine()
+        if engine is None:
+            REGISTRY.inc(MEMORY_LOOKUPS, result="unavailable")
+            return None
+        return self._query_pool.submit(engine.query, session_id, message, self.top_k)
+
+    def collect(self, future: Optional[Future], deadline: float) -> List[Dict[str, object]]:
+        """Return the lookup results if they arrive before ``deadline``, else an empty list."""
+        if future is None:
+            return []
+        try:
+            results = future.result(timeout=max(0.0, deadline - time.perf_counter()))
+        except FutureTimeoutError:
+            future.cancel()
+            REGISTRY.inc(MEMORY_LOOKUPS, result="timeout")
+            return []
+        except Exception:  # noqa: BLE001 - memories are best effort
+            REGISTRY.inc(MEMORY_LOOKUPS, result="error")
+            return []
+        memories = [
+            {"text": (result.metadata or {}).get("text", ""), "score": round(result.score, 3)}
+            for result in results
+            if result.score >= self.min_score and result.metadata
+        ]
+        REGISTRY.inc(MEMORY_LOOKUPS, result="hit" if memories else "empty")
+        return memories
+
+    def index_later(self, session_id: str, message: str) -> None:
+        engine = self._get_engine()
+        if engine is not None:
+            self._submit_index(engine, session_id, [message])
+            return
+        if self.model_loader.status == BackgroundModelLoader.FAILED:
+            REGISTRY.inc(MEMORY_INDEX_REQUESTS, result="dropped")
+            return
+        with self._pending_lock:
+            # The engine may have been built (and the queue flushed) since the check above.
+            engine = self._engine
+            if engine is None and len(self._pending) < self._max_pending:
+                self._pending.append((session_id, message))
+                REGISTRY.inc(MEMORY_INDEX_REQUESTS, result="deferred")
+                return
+        if engine is not None:
+            self._submit_index(engine, session_id, [message])
+            return
+        REGISTRY.inc(MEMORY_INDEX_REQUESTS, result="dropped")
+
+    def _flush_pending(self, engine: SemanticSearchEngine) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        by_session: Dict[str, List[str]] = {}
+        for session_id, message in pending:
+            by_session.setdefault(session_id, []).append(message)
+        for session_id, messages in by_session.items():
+            self._submit_index(engine, session_id, messages)
+
+    def _submit_index(self, engine: SemanticSearchEngine, session_id: str, messages: List[str]) -> None:
+        # Shed load instead of letting the executor queue grow without bound.
+        if not self._index_slots.acquire(blocking=False):
+            REGISTRY.inc(MEMORY_INDEX_REQUESTS, len(messages), result="dropped")
+            return
+        try:
+            future = self._index_pool.submit(engine.index_texts, session_id, messages)
+        except RuntimeError:  # pool already shut down
+            self._index_slots.release()
+            REGISTRY.inc(MEMORY_INDEX_REQUESTS, len(messages), result="dropped")
+            return
+        future.add_done_callback(lambda _: self._index_slots.release())
+        REGISTRY.inc(MEMORY_INDEX_REQUESTS, len(messages), result="queued")
+
+    def close(self) -> None:
+        self._query_pool.shutdown(wait=False, cancel_futures=True)
+        self._index_pool.shutdown(wait=True)
+        if self._engine is not None:
+            self._engine.close()
@@ -13,7 +13,10 @@ class PersonaResponder:
         persona: Persona = state["persona"]
         template = self._choose_template(persona)
         context = self._build_context(message, state)
-        return Template(template).safe_substitute(context)
+        text = Template(template).safe_substitute(context)
+        if context["memory"]:
+            text += f" Das erinnert mich an etwas, das du früher geschrieben hast: „{context['memory']}“."
+        return text
 
     def _choose_template(self, persona: Persona) -> str:
         if not persona.templates:
@@ -26,6 +29,8 @@ class PersonaResponder:
         action = random.choice(persona.actions) if persona.actions else "deinen nächsten Schritt finden"
         insight = self._build_insight(message, focus, state)
         keywords = ", ".join(state.get("matched_keywords", [])) or "deine Themen"
+        memories = state.get("memories") or []
+        memory = memories[0]["text"][:120] if memories else ""
 
         return {
             "user_message": message,
@@ -36,6 +41,7 @@ class PersonaResponder:
             "action": action,
             "insight": insight,
             "keywords": keywords,
+            "memory": memory,
         }
 
     def _build_insight(self, message: str, focus: str, state: Dict[str, object]) -> str:
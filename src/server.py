@@ -1,18 +1,44 @@
+import email.utils
 import json
 import os
+import re
+import time
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from core.metrics.registry import REGISTRY, STAGE_SECONDS
 
 from .db import InteractionStore
 from .persona_loader import PersonaRepository
 from .responder import PersonaResponder
+from .startup import StartupReport
+from .static_cache import CachedAsset, StaticAssetCache
 from .state_machine import PersonaStateMachine
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 PUBLIC_DIR = os.path.join(ROOT_DIR, 'public')
 PERSONA_DIR = os.path.join(ROOT_DIR, 'persona')
 TEMPLATE_DIR = os.path.join(ROOT_DIR, 'templates')
+EMBEDDING_MODEL_ENV = 'INNERVOICE_EMBEDDING_MODEL'
+EMBEDDING_BACKEND_ENV = 'INNERVOICE_EMBEDDING_BACKEND'
+MEMORY_BUDGET_ENV = 'INNERVOICE_MEMORY_BUDGET_MS'
+MEMORY_DB_PATH = os.path.join(ROOT_DIR, 'data', 'memory.sqlite')
+DEFAULT_SESSION_ID = 'default'
+# Session ids name a partial index in the memory store, so keep them short and unambiguous.
+SESSION_ID_PATTERN = re.compile(r'[A-Za-z0-9_]{1,64}')
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "innervoice_http_request_seconds",
+    "Time spent handling API requests, per route.",
+    ("route",),
+)
+REQUESTS_TOTAL = REGISTRY.counter(
+    "innervoice_http_requests_total",
+    "API requests handled, per route and status code.",
+    ("route", "status"),
+)
 
 
 class InnerVoiceHandler(SimpleHTTPRequestHandler):
@@ -20,21 +46,47 @@ class InnerVoiceHandler(SimpleHTTPRequestHandler):
     state_machine: PersonaStateMachine = None
     responder: PersonaResponder = None
     store: InteractionStore = None
+    startup: StartupReport = None
+    static_assets: StaticAssetCache = None
+    model_loader = None  # core.embeddings.warmup.BackgroundModelLoader, set when a model is configured
+    memory = None  # src.memory.SemanticMemory, set when a model is configured
+    route = None  # fixed metrics label of the current request, set by do_GET/do_POST
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=PUBLIC_DIR, **kwargs)
 
     def do_POST(self) -> None:
+        self.route = None
         if self.path == '/api/respond':
-            self._handle_respond()
+            self.route = '/api/respond'
+            with REGISTRY.time(REQUEST_SECONDS, route=self.route):
+                self._handle_respond()
         else:
             self.send_error(HTTPStatus.NOT_FOUND, "Endpoint not found")
 
     def do_GET(self) -> None:
+        self.route = None
         if self.path.startswith('/api/logs'):
-            self._handle_logs()
+            self.route = '/api/logs'
+            with REGISTRY.time(REQUEST_SECONDS, route=self.route):
+                self._handle_logs()
+            return
+        if self.path.startswith('/api/stats'):
+            self.route = '/api/stats'
+            with REGISTRY.time(REQUEST_SECONDS, route=self.route):
+                self._handle_stats()
+            return
+        if self.path == '/api/metrics':
+            self._handle_metrics()
+            return
+        if self.path == '/api/ready':
+            self.route = '/api/ready'
+            self._handle_ready()
             return
-        super().do_GET()
+        self._serve_static()
+
+    def do_HEAD(self) -> None:
+        self._serve_static(head_only=True)
 
     def log_message(self, format: str, *args: Any) -> None:
         # Reduce server noise
@@ -56,10 +108,30 @@ class InnerVoiceHandler(SimpleHTTPRequestHandler):
         if not message:
             self._json_response({"error": "Die Nachricht darf nicht leer sein."}, status=HTTPStatus.BAD_REQUEST)
             return
+        session_id = str(payload.get('sessionId') or DEFAULT_SESSION_ID)
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            self._json_response(
+                {"error": "Die sessionId darf nur Buchstaben, Ziffern und _ enthalten (höchstens 64 Zeichen)."},
+                status=HTTPStatus.BAD_REQUEST,
+            )
+            return
 
-        state = self.state_machine.resolve(message)
-        response_text = self.responder.render(message, state)
-        entry_id = self.store.log(message, state, response_text)
+        # Retrieval runs alongside resolution and is only used if it beats the deadline.
+        started = time.perf_counter()
+        lookup = self.memory.start_lookup(session_id, message) if self.memory is not None else None
+        with REGISTRY.time(STAGE_SECONDS, stage='resolve'):
+            state = self.state_machine.resolve(message)
+        if self.memory is not None:
+            with REGISTRY.time(STAGE_SECONDS, stage='memory_wait'):
+                state['memories'] = self.memory.collect(lookup, self.memory.deadline(started))
+        with REGISTRY.time(STAGE_SECONDS, stage='render'):
+            response_text = self.responder.render(message, state)
+        with REGISTRY.time(STAGE_SECONDS, stage='log'):
+            entry_id = self.store.log(message, state, response_text)
+        if self.memory is not None:
+            self.memory.index_later(session_id, message)
+        if self.startup is not None:
+            self.startup.mark('first_response')
 
         self._json_response(
             {
@@ -71,6 +143,7 @@ class InnerVoiceHandler(SimpleHTTPRequestHandler):
                 "response": response_text,
                 "keywords": state.get('matched_keywords'),
                 "confidence": state.get('confidence'),
+                "memories": state.get('memories', []),
             }
         )
 
@@ -92,8 +165,130 @@ class InnerVoiceHandler(SimpleHTTPRequestHandler):
         ]
         self._json_response(payload)
 
+    def _handle_stats(self) -> None:
+        query = parse_qs(urlsplit(self.path).query)
+        try:
+            days = int(query.get('days', ['30'])[0])
+        except ValueError:
+            days = 0
+        if not 1 <= days <= 366:
+            self._json_response({"error": "days muss zwischen 1 und 366 liegen."}, status=HTTPStatus.BAD_REQUEST)
+            return
+        stats = self.store.fetch_stats(days=days)
+        if self.repository is not None:
+            personas = self.repository.personas
+            stats["personaNames"] = {slug: personas[slug].name for slug in stats["personas"] if slug in personas}
+        self._json_response(stats)
+
+    def _serve_static(self, head_only: bool = False) -> None:
+        asset = self.static_assets.get(self.path) if self.static_assets is not None else None
+        if asset is None:
+            # Directory listings, redirects and 404s stay with the stock handler.
+            if head_only:
+                super().do_HEAD()
+            else:
+                super().do_GET()
+            return
+
+        encoding, body = asset.select(self.headers.get('Accept-Encoding', ''))
+        if self._not_modified(asset):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', asset.etag_for(encoding))
+            self.send_header('Last-Modified', self._last_modified(asset))
+            self.send_header('Cache-Control', asset.cache_control)
+            if asset.encodings:
+                self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+
+        if not asset.in_memory:
+            self._send_file(asset, head_only)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self._send_asset_headers(asset, len(body), encoding)
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+
+    def _send_file(self, asset: CachedAsset, head_only: bool) -> None:
+        try:
+            handle = open(asset.path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+        with handle:
+            self.send_response(HTTPStatus.OK)
+            self._send_asset_headers(asset, os.fstat(handle.fileno()).st_size)
+            self.end_headers()
+            if not head_only:
+                # Large files go straight from the page cache to the socket.
+                self.connection.sendfile(handle)
+
+    def _not_modified(self, asset: CachedAsset) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            # If-None-Match takes precedence; If-Modified-Since is then ignored.
+            return asset.matches(if_none_match)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if not if_modified_since:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        if since is None or since.tzinfo is None:
+            return False
+        # HTTP dates have one-second resolution.
+        return asset.mtime_ns // 1_000_000_000 <= since.timestamp()
+
+    @staticmethod
+    def _last_modified(asset: CachedAsset) -> str:
+        return email.utils.formatdate(asset.mtime_ns // 1_000_000_000, usegmt=True)
+
+    def _send_asset_headers(self, asset: CachedAsset, content_length: int, encoding: Optional[str] = None) -> None:
+        self.send_header('Content-Type', asset.content_type)
+        self.send_header('Content-Length', str(content_length))
+        self.send_header('ETag', asset.etag_for(encoding))
+        self.send_header('Last-Modified', self._last_modified(asset))
+        self.send_header('Cache-Control', asset.cache_control)
+        if asset.encodings:
+            self.send_header('Vary', 'Accept-Encoding')
+
+    def _embedding_status(self) -> str:
+        if self.model_loader is None:
+            return 'disabled'
+        return self.model_loader.status
+
+    def _handle_ready(self) -> None:
+        embeddings = self._embedding_status()
+        # A failed model is reported but does not block readiness: responses fall back to keywords.
+        ready = self.state_machine is not None and embeddings != 'loading'
+        payload: Dict[str, Any] = {
+            "ready": ready,
+            "components": {"personas": self.state_machine is not None, "embeddings": embeddings},
+            "startup": self.startup.as_dict() if self.startup is not None else None,
+        }
+        if self.model_loader is not None:
+            payload["embeddingTimings"] = self.model_loader.timings
+            if self.model_loader.error is not None:
+                payload["embeddingError"] = str(self.model_loader.error)
+        self._json_response(payload, status=HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE)
+
+    def _handle_metrics(self) -> None:
+        body = REGISTRY.render_prometheus().encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def _json_response(self, payload: Dict[str, Any], status: HTTPStatus = HTTPStatus.OK) -> None:
         body = json.dumps(payload).encode('utf-8')
+        if self.route is not None:
+            REGISTRY.inc(REQUESTS_TOTAL, route=self.route, status=str(int(status)))
         self.send_response(status)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Content-Length', str(len(body)))
@@ -101,17 +296,51 @@ class InnerVoiceHandler(SimpleHTTPRequestHandler):
         self.wfile.write(body)
 
 
+def start_model_loader(startup: StartupReport):
+    """Build and warm the configured embedding model in the background, if any."""
+    model_path = os.environ.get(EMBEDDING_MODEL_ENV)
+    if not model_path:
+        return None
+    backend = os.environ.get(EMBEDDING_BACKEND_ENV, 'onnx')
+
+    # Deferred so that servers without a model never import the embedding stack.
+    from core.embeddings.model_loader import create_embedding_model
+    from core.embeddings.warmup import BackgroundModelLoader
+
+    def on_done(loader) -> None:
+        startup.mark(f"embeddings_{loader.status}")
+        if loader.error is not None:
+            print(f"Embedding-Modell konnte nicht geladen werden: {loader.error}")
+
+    return BackgroundModelLoader(lambda: create_embedding_model(model_path, backend), on_done=on_done).start()
+
+
 def run(server_class=ThreadingHTTPServer, handler_class=InnerVoiceHandler) -> None:
-    repository = PersonaRepository(PERSONA_DIR, TEMPLATE_DIR)
-    personas = repository.personas
-    handler_class.repository = repository
-    handler_class.state_machine = PersonaStateMachine(personas)
-    handler_class.responder = PersonaResponder(personas)
-    handler_class.store = InteractionStore()
+    startup = StartupReport()
+    handler_class.startup = startup
+    handler_class.model_loader = start_model_loader(startup)
+    if handler_class.model_loader is not None:
+        from .memory import DEFAULT_BUDGET_MS, SemanticMemory
+
+        budget_ms = float(os.environ.get(MEMORY_BUDGET_ENV, DEFAULT_BUDGET_MS))
+        handler_class.memory = SemanticMemory(handler_class.model_loader, MEMORY_DB_PATH, budget_ms=budget_ms)
+    with startup.phase('personas'):
+        repository = PersonaRepository(PERSONA_DIR, TEMPLATE_DIR)
+        personas = repository.personas
+        handler_class.repository = repository
+        handler_class.state_machine = PersonaStateMachine(personas)
+        handler_class.responder = PersonaResponder(personas)
+    with startup.phase('store'):
+        handler_class.store = InteractionStore()
+    with startup.phase('static_assets'):
+        handler_class.static_assets = StaticAssetCache(PUBLIC_DIR).load()
 
     server_address = ('', 8000)
-    httpd = server_class(server_address, handler_class)
+    with startup.phase('bind'):
+        httpd = server_class(server_address, handler_class)
+    startup.mark('accepting')
     print("InnerVoice läuft auf http://localhost:8000")
+    print(startup.summary())
     print("Drücke STRG+C zum Beenden")
     try:
         httpd.serve_forever()
@@ -119,6 +348,8 @@ def run(server_class=ThreadingHTTPServer, handler_class=InnerVoiceHandler) -> No
         print("\nServer wird beendet...")
     finally:
         httpd.server_close()
+        if handler_class.memory is not None:
+            handler_class.memory.close()
 
 
 if __name__ == '__main__':
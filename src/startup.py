@@ -0,0 +1,47 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# Anchor for startup timings: the moment the server modules were imported.
+_IMPORT_ANCHOR = time.perf_counter()
+
+
+class StartupReport:
+    def __init__(self, anchor: float = _IMPORT_ANCHOR) -> None:
+        self.anchor = anchor
+        self.phases: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _elapsed_ms(self, since: float) -> float:
+        return round((time.perf_counter() - since) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases[name] = self._elapsed_ms(started)
+
+    def mark(self, name: str) -> None:
+        """Record the time since the anchor, keeping only the first occurrence."""
+        with self._lock:
+            if name not in self.marks:
+                self.marks[name] = self._elapsed_ms(self.anchor)
+
+    def get_mark(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self.marks.get(name)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {"phasesMs": dict(self.phases), "marksMs": dict(self.marks)}
+
+    def summary(self) -> str:
+        data = self.as_dict()
+        parts = [f"{name}={value:.1f}ms" for name, value in data["phasesMs"].items()]
+        parts += [f"{name}@{value:.1f}ms" for name, value in data["marksMs"].items()]
+        return "Startzeiten: " + ", ".join(parts)
@@ -0,0 +1,185 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import posixpath
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from core.metrics.registry import record_cache
+
+try:  # Brotli is optional; without it only gzip variants are precomputed.
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/javascript',
+    'application/json',
+    'application/xml',
+    'image/svg+xml',
+)
+MIN_COMPRESS_BYTES = 512
+DEFAULT_INLINE_LIMIT = 512 * 1024
+DEFAULT_CHECK_INTERVAL = 2.0
+# Each encoded body is its own representation and gets its own strong ETag.
+ETAG_SUFFIXES = {'gzip': '-gz', 'br': '-br'}
+
+
+@dataclass
+class CachedAsset:
+    path: str
+    content_type: str
+    etag: str
+    size: int
+    mtime_ns: int
+    cache_control: str
+    body: Optional[bytes] = None
+    encodings: Dict[str, bytes] = field(default_factory=dict)
+    checked_at: float = 0.0
+
+    @property
+    def in_memory(self) -> bool:
+        return self.body is not None
+
+    def select(self, accept_encoding: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """Pick the best precompressed variant the client accepts."""
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in accepted and encoding in self.encodings:
+                return encoding, self.encodings[encoding]
+        return None, self.body
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        if encoding is None:
+            return self.etag
+        return self.etag[:-1] + ETAG_SUFFIXES[encoding] + '"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """Weak comparison against the identity and every encoded variant."""
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if '*' in tags:
+            return True
+        known = {self.etag_for(encoding) for encoding in (None, *self.encodings)}
+        return any((tag[2:] if tag.startswith('W/') else tag) in known for tag in tags)
+
+
+def _accepted_encodings(header: str) -> List[str]:
+    accepted = []
+    for part in header.split(','):
+        token, _, params = part.strip().partition(';')
+        params = params.replace(' ', '')
+        if not token or params in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.append(token.lower())
+    return accepted
+
+
+def _cache_control(content_type: str) -> str:
+    # Asset names are not content-hashed, so HTML must always revalidate and
+    # everything else may only be reused for a short while without asking.
+    if content_type.startswith('text/html'):
+        return 'no-cache'
+    return 'public, max-age=300'
+
+
+class StaticAssetCache:
+    def __init__(
+        self,
+        root: str,
+        inline_limit: int = DEFAULT_INLINE_LIMIT,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ) -> None:
+        self.root = os.path.realpath(root)
+        self.inline_limit = inline_limit
+        self.check_interval = check_interval
+        self._assets: Dict[str, CachedAsset] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> 'StaticAssetCache':
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                self._load_file(os.path.join(directory, filename))
+        return self
+
+    def _load_file(self, path: str) -> Optional[CachedAsset]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._assets.pop(path, None)
+            return None
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/'):
+            content_type += '; charset=utf-8'
+        asset = CachedAsset(
+            path=path,
+            content_type=content_type,
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            cache_control=_cache_control(content_type),
+            checked_at=time.monotonic(),
+        )
+        if stat.st_size <= self.inline_limit:
+            with open(path, 'rb') as handle:
+                body = handle.read()
+            asset.body = body
+            asset.size = len(body)
+            asset.etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+            if len(body) >= MIN_COMPRESS_BYTES and content_type.startswith(COMPRESSIBLE_TYPES):
+                compressed = gzip.compress(body, compresslevel=9, mtime=0)
+                if len(compressed) < len(body):
+                    asset.encodings['gzip'] = compressed
+                if brotli is not None:
+                    compressed = brotli.compress(body, quality=11)
+                    if len(compressed) < len(body):
+                        asset.encodings['br'] = compressed
+        with self._lock:
+            self._assets[path] = asset
+        return asset
+
+    def resolve_path(self, url_path: str) -> Optional[str]:
+        """Map a request path to a file under the root, rejecting traversal."""
+        path = posixpath.normpath(unquote(urlsplit(url_path).path))
+        parts = [part for part in path.split('/') if part and part not in ('.', '..')]
+        candidate = os.path.realpath(os.path.join(self.root, *parts))
+        if candidate != self.root and not candidate.startswith(self.root + os.sep):
+            return None
+        if os.path.isdir(candidate):
+            candidate = os.path.join(candidate, 'index.html')
+        return candidate
+
+    def get(self, url_path: str) -> Optional[CachedAsset]:
+        path = self.resolve_path(url_path)
+        if path is None:
+            return None
+        with self._lock:
+            asset = self._assets.get(path)
+        if asset is None:
+            # Files added after startup are picked up on first request.
+            if not os.path.isfile(path):
+                return None
+            record_cache('static_assets', hit=False)
+            return self._load_file(path)
+        now = time.monotonic()
+        if now - asset.checked_at < self.check_interval:
+            record_cache('static_assets', hit=True)
+            return asset
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._assets.pop(path, None)
+            return None
+        if stat.st_mtime_ns != asset.mtime_ns or stat.st_size != asset.size:
+            record_cache('static_assets', hit=False)
+            return self._load_file(path)
+        asset.checked_at = now
+        record_cache('static_assets', hit=True)
+        return asset